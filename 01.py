@@ -1,22 +1,44 @@
 #! /usr/bin/env python3
 
+import heapq
+
 import aoc
 
 
-def main(timer: aoc.Timer) -> None:
-    elves = list(
-        reversed(
-            sorted(
-                [
-                    sum(int(line.strip()) for line in elf.split("\n") if line)
-                    for elf in aoc.get_str(1).split("\n\n")
-                ]
-            )
-        )
+def streamed_top(k: int) -> list[int]:
+    # A bounded heap over the streamed blocks, so only k sums are ever kept
+    return heapq.nlargest(k, (sum(map(int, elf)) for elf in aoc.iter_blocks()))
+
+
+def vectorized_top(k: int, numpy: any) -> list[int]:
+    if k <= 0:
+        return []
+    text = bytes(aoc.get_buffer()).strip()
+    if b"\r" in text:
+        text = text.replace(b"\r\n", b"\n")
+    # Mark the empty lines with -1 so one call parses every number
+    calories = numpy.fromstring(
+        text.replace(b"\n\n", b"\n-1\n"), dtype=numpy.int64, sep="\n"
     )
-    print(elves[0])
+    markers = numpy.flatnonzero(calories < 0)
+    calories[markers] = 0
+    totals = numpy.add.reduceat(calories, numpy.concatenate(([0], markers)))
+    k = min(k, len(totals))
+    return sorted(numpy.partition(totals, -k)[-k:].tolist(), reverse=True)
+
+
+def main(timer: aoc.Timer, k: int = 3, vectorized: bool | None = None) -> None:
+    # The NumPy path holds the whole input in memory, so by default only huge
+    # inputs use it. vectorized forces or disables it.
+    if vectorized is None:
+        vectorized = len(aoc.get_buffer()) >= aoc.VECTORIZE_FROM_BYTES
+    if vectorized and (numpy := aoc.optional_numpy()) is not None:
+        top = vectorized_top(k, numpy)
+    else:
+        top = streamed_top(k)
+    print(top[0])
     timer.mark()
-    print(sum(elves[:3]))
+    print(sum(top))
 
 
 if __name__ == "__main__":
@@ -65,16 +65,27 @@ class Game:
         return self.victory_score + self.right.base_score
 
 
+# The nine possible lines and their scores, so scoring is a lookup per line type
+HANDS: dict[bytes, tuple[Hand, Hand]] = {
+    f"{left} {right}".encode(): (Hand.from_letter(left), Hand.from_letter(right))
+    for left in "ABC"
+    for right in "XYZ"
+}
+SCORES: dict[bytes, int] = {
+    line: (left @ right).total_game_score for line, (left, right) in HANDS.items()
+}
+STRATEGY_SCORES: dict[bytes, int] = {
+    line: (left @ left.move_according_to(right)).total_game_score
+    for line, (left, right) in HANDS.items()
+}
+
+
 def main(timer: aoc.Timer) -> None:
-    games = [[Hand.from_letter(c) for c in lne.split(" ")] for lne in aoc.get_lines(2)]
-    print(sum((a @ b).total_game_score for a, b in games))
+    data = bytes(aoc.get_buffer())
+    counts = {line: data.count(line) for line in HANDS}
+    print(sum(count * SCORES[line] for line, count in counts.items()))
     timer.mark()
-    print(
-        sum(
-            (a @ b).total_game_score
-            for a, b in [(a, a.move_according_to(b)) for a, b in games]
-        )
-    )
+    print(sum(count * STRATEGY_SCORES[line] for line, count in counts.items()))
 
 
 if __name__ == "__main__":
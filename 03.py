@@ -3,34 +3,63 @@
 import string
 
 import aoc
-import more_itertools
 
+PRIORITIES = [0] * 256
+for priority, letter in enumerate(string.ascii_letters, 1):
+    PRIORITIES[ord(letter)] = priority
 
-def priority(character: str) -> int:
-    return string.ascii_letters.index(character) + 1
 
+def common(left: bytes, right: bytes) -> bytes:
+    # Deleting what is not in right from left leaves what is in both
+    return left.translate(None, left.translate(None, right))
 
-def halfs(rucksack: str) -> tuple[str, str]:
-    halfway = int(len(rucksack) / 2)
+
+def halves(rucksack: bytes) -> tuple[bytes, bytes]:
+    halfway = len(rucksack) // 2
     return rucksack[:halfway], rucksack[halfway:]
 
 
-def intersection(left: str, right: str, very_right: str | None = None) -> str:
-    for character in left:
-        if character in right:
-            if very_right is None or character in very_right:
-                return character
-    assert False
+def priorities(rucksacks: list[bytes]) -> tuple[int, int]:
+    return (
+        sum(PRIORITIES[common(*halves(rucksack))[0]] for rucksack in rucksacks),
+        sum(
+            PRIORITIES[common(common(first, second), third)[0]]
+            for first, second, third in zip(*[iter(rucksacks)] * 3)
+        ),
+    )
 
 
-def groups(rucksacks: list[str]) -> list[tuple[str, str, str]]:
-    return list(more_itertools.chunked(rucksacks, 3))
+def vectorized_priorities(data: bytes, numpy: any) -> tuple[int, int]:
+    # One bit per item type, so the priority of a single bit mask is its bit length
+    bits = numpy.zeros(256, dtype=numpy.uint64)
+    for index, letter in enumerate(string.ascii_letters):
+        bits[ord(letter)] = 1 << index
+    items = numpy.frombuffer(data + b"\n", dtype=numpy.uint8)
+    ends = numpy.flatnonzero(items == ord("\n"))
+    starts = numpy.concatenate(([0], ends[:-1] + 1))
+    # OR the bits of every half in one go, the line breaks have no bits
+    bounds = numpy.empty(2 * len(starts), dtype=numpy.int64)
+    bounds[0::2], bounds[1::2] = starts, starts + (ends - starts) // 2
+    masks = numpy.bitwise_or.reduceat(bits[items], bounds)
+    left, right = masks[0::2], masks[1::2]
+    badges = numpy.bitwise_and.reduce((left | right).reshape(-1, 3), axis=1)
+    # The exponent of a power of two is its bit length
+    return (
+        int(numpy.frexp((left & right).astype(float))[1].sum()),
+        int(numpy.frexp(badges.astype(float))[1].sum()),
+    )
 
 
 def main(timer: aoc.Timer) -> None:
-    print(sum(priority(intersection(*halfs(rucksack))) for rucksack in aoc.get_lines()))
+    data = bytes(aoc.get_buffer()).strip().replace(b"\r\n", b"\n")
+    numpy = aoc.optional_numpy() if len(data) >= aoc.VECTORIZE_FROM_BYTES else None
+    if numpy is not None:
+        compartments, groups = vectorized_priorities(data, numpy)
+    else:
+        compartments, groups = priorities(data.split())
+    print(compartments)
     timer.mark()
-    print(sum(priority(intersection(*group)) for group in groups(aoc.get_lines())))
+    print(groups)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,11 @@ import aoc
 
 def main(timer: aoc.Timer) -> None:
     stack_config = aoc.get_str().split("\n\n", 1)[0].split("\n")[-2::-1]
+    moves: list[tuple[int, int, int]] = (
+        aoc.Parse()
+        .regex_lines("(.+)", [str])
+        .regex_lines(r"move (\d+) from (\d) to (\d)", [int, int, int])[1]
+    )
 
     def get_stacks() -> list[list[str]]:
         return [
@@ -21,11 +26,7 @@ def main(timer: aoc.Timer) -> None:
             stacks[to_stack_index - 1].append(stacks[from_stack_index - 1].pop(index))
 
     def move_all(do_print: bool = False) -> None:
-        for amount, from_stack_index, to_stack_index in (
-            aoc.Parse()
-            .regex_lines("(.+)", [str])
-            .regex_lines(r"move (\d+) from (\d) to (\d)", [int, int, int])[1]
-        ):
+        for amount, from_stack_index, to_stack_index in moves:
             if do_print:
                 printstacks()
                 print(
@@ -36,11 +37,7 @@ def main(timer: aoc.Timer) -> None:
             printstacks()
 
     def move_all2(do_print: bool = False) -> None:
-        for amount, from_stack_index, to_stack_index in (
-            aoc.Parse()
-            .regex_lines("(.+)", [str])
-            .regex_lines(r"move (\d+) from (\d) to (\d)", [int, int, int])[1]
-        ):
+        for amount, from_stack_index, to_stack_index in moves:
             if do_print:
                 printstacks()
                 print(
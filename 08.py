@@ -1,67 +1,78 @@
 #! /usr/bin/env python3
 
 import aoc
-import matplotlib.pyplot as plt
 
+EDGE = 255  # Around the forest
 
-def main(timer: aoc.Timer) -> None:
-    tree_heights: list[list[int]] = aoc.get_dense_int_matrix()
-    height = len(tree_heights)
-    width = len(tree_heights[0])
 
-    def is_hidden(y: int, x: int) -> bool:
-        target_height = tree_heights[y][x]
-        return (
-            any(tree_heights[y_][x] >= target_height for y_ in range(y))
-            and any(tree_heights[y_][x] >= target_height for y_ in range(y + 1, height))
-            and any(tree_heights[y][x_] >= target_height for x_ in range(x))
-            and any(tree_heights[y][x_] >= target_height for x_ in range(x + 1, width))
-        )
+def count_visible(grid: aoc.Grid) -> int:
+    """Walk every line of trees from both ends and mark the ones taller than
+    all before them."""
+    trees = grid.cells
+    visible = bytearray(len(trees))
+    walks = (
+        [(grid.index(0, y), 1) for y in range(grid.height)]
+        + [(grid.index(grid.width - 1, y), -1) for y in range(grid.height)]
+        + [(grid.index(x, 0), grid.stride) for x in range(grid.width)]
+        + [(grid.index(x, grid.height - 1), -grid.stride) for x in range(grid.width)]
+    )
+    for index, step in walks:
+        tallest = -1
+        while (tree := trees[index]) != EDGE and tallest < 9:
+            if tree > tallest:
+                visible[index] = True
+                tallest = tree
+            index += step
+    return sum(visible)
+
+
+def count_visible_vectorized(grid: aoc.Grid, numpy: any) -> int:
+    heights = (
+        numpy.frombuffer(grid.cells, dtype=numpy.uint8)
+        .reshape(grid.height + 2, grid.stride)[1:-1, 1:-1]
+        .astype(numpy.int8)
+    )
+
+    def visible_from_left(heights: any) -> any:
+        """Mark the trees that are taller than every tree left of them."""
+        blocking = numpy.full_like(heights, -1)
+        blocking[:, 1:] = numpy.maximum.accumulate(heights, axis=1)[:, :-1]
+        return heights > blocking
+
+    return int(
+        (
+            visible_from_left(heights)
+            | visible_from_left(heights[:, ::-1])[:, ::-1]
+            | visible_from_left(heights.T).T
+            | visible_from_left(heights.T[:, ::-1])[:, ::-1].T
+        ).sum()
+    )
 
-    def scenic_score(y: int, x: int) -> int:
-        target_height = tree_heights[y][x]
+
+def main(timer: aoc.Timer) -> None:
+    grid = aoc.Grid.from_input(offset=ord("0"), border=EDGE)
+    trees = grid.cells
+
+    def scenic_score(index: int) -> int:
+        target_height = trees[index]
         score = 1
-        accumulator = 0
-        for y_ in range(y - 1, -1, -1):
-            accumulator += 1
-            if tree_heights[y_][x] >= target_height:
-                break
-        score *= accumulator
-        accumulator = 0
-        for y_ in range(y + 1, height):
-            accumulator += 1
-            if tree_heights[y_][x] >= target_height:
-                break
-        score *= accumulator
-        accumulator = 0
-        for x_ in range(x - 1, -1, -1):
-            accumulator += 1
-            if tree_heights[y][x_] >= target_height:
-                break
-        score *= accumulator
-        accumulator = 0
-        for x_ in range(x + 1, width):
-            accumulator += 1
-            if tree_heights[y][x_] >= target_height:
-                break
-        score *= accumulator
+        for offset in grid.offsets:
+            distance = 0
+            neighbor = index + offset
+            while (tree := trees[neighbor]) != EDGE:
+                distance += 1
+                if tree >= target_height:
+                    break
+                neighbor += offset
+            score *= distance
         return score
 
-    hidden_trees = [
-        [is_hidden(y, x) for x, _ in enumerate(row)]
-        for y, row in enumerate(tree_heights)
-    ]
-    print(width * height - sum(sum(row) for row in hidden_trees))
+    if len(trees) >= aoc.VECTORIZE_FROM_BYTES and (numpy := aoc.optional_numpy()):
+        print(count_visible_vectorized(grid, numpy))
+    else:
+        print(count_visible(grid))
     timer.mark()
-    scenic_scores = [
-        [scenic_score(y, x) for x, _ in enumerate(row)]
-        for y, row in enumerate(tree_heights)
-    ]
-    print(max(max(row) for row in scenic_scores))
-
-    # plt.imshow(tree_heights)
-    # # plt.imshow(hidden_trees)
-    # plt.show()
+    print(max(scenic_score(index) for index in grid.indices()))
 
 
 if __name__ == "__main__":
@@ -27,7 +27,7 @@ class CPU:
 
 def main(timer: aoc.Timer) -> None:
     cpu = CPU()
-    for line in aoc.get_lines():
+    for line in aoc.iter_lines():
         match line.split(" "):
             case ["noop"]:
                 cpu.noop()
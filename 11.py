@@ -6,7 +6,6 @@ from operator import mul
 from typing import Callable
 
 import aoc
-from tqdm import tqdm
 
 
 def main(timer: aoc.Timer) -> None:
@@ -55,20 +54,17 @@ def main(timer: aoc.Timer) -> None:
                 int(lines[4].split("If true: throw to monkey ")[1]),
             )
 
-        def evaluate(self, unlimited_worry: bool = False) -> None:
+        def evaluate(self) -> None:
             for item in self.items:
-                value: int
-                if unlimited_worry:
-                    value = self.operation(item) % least_common_multiple
-                else:
-                    value = int(self.operation(item) / 3.0)
+                value = int(self.operation(item) / 3.0)
                 monkeys[self.target_monkeys[value % self.divisor == 0]].items.append(
                     value
                 )
                 self.items_evaluated += 1
             self.items = []
 
-    monkeys = [Monkey(spec) for spec in aoc.get_str().split("\n\n")]
+    specs = aoc.get_str().split("\n\n")
+    monkeys = [Monkey(spec) for spec in specs]
 
     for _ in range(20):
         for monkey in monkeys:
@@ -78,14 +74,30 @@ def main(timer: aoc.Timer) -> None:
 
     timer.mark()
 
-    monkeys = [Monkey(spec) for spec in aoc.get_str().split("\n\n")]
+    monkeys = [Monkey(spec) for spec in specs]
     least_common_multiple = reduce(mul, [monkey.divisor for monkey in monkeys], 1)
 
-    for _ in tqdm(range(10000)):
-        for monkey in monkeys:
-            monkey.evaluate(unlimited_worry=True)
-
-    print(reduce(mul, sorted([monkey.items_evaluated for monkey in monkeys])[-2:], 1))
+    def inspections(item: tuple[int, int]) -> list[int]:
+        # Without the division items do not affect each other anymore so every
+        # item can be followed on its own. It is inspected again in the same
+        # round if it is thrown to a monkey that did not have its turn yet.
+        monkey_number, value = item
+        counts = [0] * len(monkeys)
+        for _ in range(10000):
+            while True:
+                monkey = monkeys[monkey_number]
+                counts[monkey_number] += 1
+                value = monkey.operation(value) % least_common_multiple
+                target = monkey.target_monkeys[value % monkey.divisor == 0]
+                if target < monkey_number:
+                    monkey_number = target
+                    break
+                monkey_number = target
+        return counts
+
+    items = [(monkey.number, item) for monkey in monkeys for item in monkey.items]
+    totals = [sum(counts) for counts in zip(*aoc.pmap(inspections, items))]
+    print(reduce(mul, sorted(totals)[-2:], 1))
 
 
 if __name__ == "__main__":
@@ -1,78 +1,24 @@
 #! /usr/bin/env python3
 
-import string
-from queue import Queue
-
 import aoc
 
 
 def main(timer: aoc.Timer) -> None:
-    height_map = aoc.get_lines()
-    start: tuple[int, int]
-    end: tuple[int, int]
-    altitudes: list[list[int]] = []
-    for y, line in enumerate(height_map):
-        altitudes.append([])
-        for x, char in enumerate(line):
-            value: int
-            try:
-                value = string.ascii_lowercase.index(char)
-            except ValueError:
-                if char == "S":
-                    start = (y, x)
-                    value = 0
-                elif char == "E":
-                    end = (y, x)
-                    value = 25
-                else:
-                    assert False, char
-            altitudes[-1].append(value)
+    grid = aoc.Grid.from_input()
+    start, end = grid.find(ord("S")), grid.find(ord("E"))
+    altitudes = grid.cells
+    altitudes[start], altitudes[end] = ord("a"), ord("z")
     timer.mark("Parsing")
 
-    explored: set[tuple[int, int]] = set()
-    queue = Queue()
-    queue.put((*start, 0))
-
-    while queue.qsize():  # BFS
-        y, x, distance = queue.get()
-        if (y, x) == end:
-            print(distance)
-            break
-        if (y, x) in explored:
-            continue
-        for y_, x_ in [(y - 1, x), (y, x - 1), (y + 1, x), (y, x + 1)]:
-            if not (0 <= y_ < len(altitudes) and 0 <= x_ < len(altitudes[0])):
-                continue
-            if altitudes[y_][x_] > altitudes[y][x] + 1:
-                continue
-            queue.put((y_, x_, distance + 1))
-        explored.add((y, x))
-    else:
-        print("No path??")
+    climb = grid.moves(lambda here, there: there <= here + 1)
+    distance = aoc.bfs([start], climb, lambda index: index == end)
+    print("No path??" if distance is None else distance)
 
     timer.mark()
-    # crappy paste
-
-    explored: set[tuple[int, int]] = set()
-    queue = Queue()
-    queue.put((*end, 0))
 
-    while queue.qsize():  # BFS
-        y, x, distance = queue.get()
-        if (altitude := altitudes[y][x]) == 0:
-            print(distance)
-            break
-        if (y, x) in explored:
-            continue
-        for y_, x_ in [(y - 1, x), (y, x - 1), (y + 1, x), (y, x + 1)]:
-            if not (0 <= y_ < len(altitudes) and 0 <= x_ < len(altitudes[0])):
-                continue
-            if altitudes[y_][x_] < altitude - 1:
-                continue
-            queue.put((y_, x_, distance + 1))
-        explored.add((y, x))
-    else:
-        print("No path??")
+    descend = grid.moves(lambda here, there: there >= here - 1)
+    distance = aoc.bfs([end], descend, lambda index: altitudes[index] == ord("a"))
+    print("No path??" if distance is None else distance)
 
 
 if __name__ == "__main__":
@@ -17,12 +17,17 @@ class Order(Enum):
     WRONG = 1
 
 
-def main(timer: aoc.Timer) -> None:
-    inputs: list[tuple[Package, Package]] = [
+@aoc.cached_parse
+def parse_pairs() -> list[tuple[Package, Package]]:
+    return [
         [eval(line) for line in block.strip().split("\n")]
         for block in aoc.get_str().split("\n\n")
     ]
 
+
+def main(timer: aoc.Timer) -> None:
+    inputs = parse_pairs()
+
     timer.mark("Preprocessing")
 
     def order(left: Package, right: Package) -> Order:
@@ -4,8 +4,12 @@ import itertools
 
 import aoc
 
+# Cell values, everything below ROCK can be fallen through.
+AIR, ABYSS, ROCK, SAND = 0, 1, 2, 3
 
-def main(timer: aoc.Timer) -> None:
+
+@aoc.cached_parse
+def parse_rocks() -> set[tuple[int, int]]:
     occupied_spaces: set[tuple[int, int]] = set()
     for line in aoc.get_lines():
         for (x1, y1), (x2, y2) in itertools.pairwise(
@@ -22,48 +26,49 @@ def main(timer: aoc.Timer) -> None:
                     occupied_spaces.add((x, y1))
             else:
                 assert False
+    return occupied_spaces
 
-    timer.mark("Preprocessing")
 
-    max_y = max([space[1] for space in occupied_spaces])
-    sand_count = 0
-    running = True
-    while running:
-        x = 500
-        y = 0
-        sand_count += 1
-        while True:
-            if y > max_y:
-                running = False
-                break
-            for x_, y_ in ((x, y + 1), (x - 1, y + 1), (x + 1, y + 1)):
-                if (x_, y_) not in occupied_spaces:
-                    x, y = x_, y_
+def main(timer: aoc.Timer) -> None:
+    rocks = parse_rocks()
+    max_y = max(y for _, y in rocks)
+    # Wide enough for the pile of part 2 so sand never reaches the border.
+    left = min(min(x for x, _ in rocks), 500 - max_y - 2)
+    right = max(max(x for x, _ in rocks), 500 + max_y + 2)
+    grid = aoc.Grid(right - left + 1, max_y + 3)
+    for x, y in rocks:
+        grid[x - left, y] = ROCK
+    grid.row(max_y + 1)[:] = bytes([ABYSS]) * grid.width
+    cells = grid.cells
+    source = grid.index(500 - left, 0)
+    falls = (grid.stride, grid.stride - 1, grid.stride + 1)
+
+    def pour() -> int:
+        resting = 0
+        while cells[source] == AIR:
+            index = source
+            while True:
+                for fall in falls:
+                    if cells[index + fall] < ROCK:
+                        index += fall
+                        break
+                else:
+                    cells[index] = SAND
+                    resting += 1
                     break
-            else:
-                occupied_spaces.add((x, y))
-                break
+                if cells[index] == ABYSS:
+                    return resting
+        return resting
 
-    sand_count -= 1
+    timer.mark("Preprocessing")
+
+    sand_count = pour()
     print(sand_count)
 
     timer.mark()
-    running = True
-    while running:
-        x = 500
-        y = 0
-        sand_count += 1
-        while True:
-            for x_, y_ in ((x, y + 1), (x - 1, y + 1), (x + 1, y + 1)):
-                if (x_, y_) not in occupied_spaces and y_ < max_y + 2:
-                    x, y = x_, y_
-                    break
-            else:
-                occupied_spaces.add((x, y))
-                if (x, y) == (500, 0):
-                    running = False
-                break
-
+    grid.row(max_y + 1)[:] = bytes([AIR]) * grid.width
+    grid.row(max_y + 2)[:] = bytes([ROCK]) * grid.width
+    sand_count += pour()
     print(sand_count)
 
 
@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from functools import cached_property
 
 import aoc
-from tqdm import tqdm
 
 
 def manhattan(x1: int, y1: int, x2: int, y2: int) -> int:
@@ -78,8 +77,19 @@ def main(timer: aoc.Timer, simple: bool = False) -> None:
 
     timer.mark("Preprocessing")
 
+    # Scan the line in independent stretches, one task each.
+    stretch = (max_x - min_x) // (8 * aoc.available_cores()) + 1
     print(
-        sum(cannot_contain_beacon(x, scanline) for x in tqdm(range(min_x, max_x + 1)))
+        sum(
+            aoc.pmap(
+                lambda xs: sum(cannot_contain_beacon(x, scanline) for x in xs),
+                [
+                    range(x, min(x + stretch, max_x + 1))
+                    for x in range(min_x, max_x + 1, stretch)
+                ],
+                chunksize=1,
+            )
+        )
     )
 
     timer.mark()
@@ -97,8 +107,8 @@ def main(timer: aoc.Timer, simple: bool = False) -> None:
     # the search space and reduces the runtime from ~3.5years to a few minutes.
     x, y = next(
         (x, y)
-        for sensor in tqdm(sensors, leave=False)
-        for (x, y) in tqdm(sensor.perimeter, leave=False)
+        for sensor in aoc.progress(sensors, name="Sensors")
+        for (x, y) in sensor.perimeter
         if 0 <= x <= width
         and 0 <= y <= width
         and not cannot_contain_beacon(x, y, exclude_beacon=False)
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import itertools
 from dataclasses import dataclass, field
-from queue import PriorityQueue, Queue
+from queue import PriorityQueue
 from typing import Generator
 
 import aoc
-from tqdm import tqdm
 
 
 @dataclass
@@ -23,32 +22,24 @@ class Valve:
 
 
 def main(timer: aoc.Timer) -> None:
-    valves = {
-        args[0]: Valve(*args)
-        for args in aoc.Parse()
-        .regex_lines(
-            r"Valve (.+) has flow rate=(\d+); tunnels? leads? to valves? (.+)",
-            (str, int, str),
+    with timer.span("Parsing"):
+        valves = {
+            args[0]: Valve(*args)
+            for args in aoc.Parse()
+            .regex_lines(
+                r"Valve (.+) has flow rate=(\d+); tunnels? leads? to valves? (.+)",
+                (str, int, str),
+            )
+            .get()
+        }
+        true_valves = [v.name for v in valves.values() if v.flow_rate]
+
+    with timer.span("Distances"):
+        distances: dict[str, dict[str, int]] = aoc.all_pairs_distances(
+            {"AA", *true_valves},
+            lambda valve: valves[valve].destination_valve_names,
+            targets=true_valves,
         )
-        .get()
-    }
-    true_valves = [v.name for v in valves.values() if v.flow_rate]
-
-    distances: dict[dict[str, int]] = {}
-    for start_valve in set(["AA", *list(true_valves)]):
-        distances[start_valve] = {}
-        queue = Queue()
-        queue.put((start_valve, 0))
-        found_nodes: set[str] = set([start_valve])
-        while queue.qsize():  # BFS
-            valve, distance = queue.get()
-            found_nodes.add(valve)
-            if valve in true_valves:
-                distances[start_valve][valve] = distance
-            for adjacent in valves[valve].destination_valve_names:
-                if adjacent in found_nodes:
-                    continue
-                queue.put((adjacent, distance + 1))
 
     timer.mark("Reducing")
 
@@ -100,6 +91,7 @@ def main(timer: aoc.Timer) -> None:
         def __lt__(self, other: ExplorationState) -> bool:
             return self.time_passed < other.time_passed
 
+    @timer.span("Search")
     def search() -> list[ExplorationState]:
         queue = PriorityQueue()
         queue.put(ExplorationState())
@@ -122,12 +114,15 @@ def main(timer: aoc.Timer) -> None:
 
     THE_END = 26
 
-    combi_flow_rates: list[int] = []
     states = [
         s for s in search() if s.accumulated_flow_rate > 0.5 * optimal_single_search
     ]
-    for a, b in tqdm(
-        itertools.permutations(states, 2), total=len(states) * (len(states) - 1)
+    # The elephant could also just stay put, e.g. if there is a single valve.
+    combi_flow_rates: list[int] = [max(s.accumulated_flow_rate for s in states)]
+    for a, b in aoc.progress(
+        itertools.permutations(states, 2),
+        total=len(states) * (len(states) - 1),
+        name="Pairs",
     ):
         if set(a.open_valves).intersection(b.open_valves):
             continue
@@ -18,7 +18,6 @@ from functools import cache
 from itertools import cycle, zip_longest
 
 import aoc
-from tqdm import tqdm
 
 ROCKS = [
     [0b0011110],
@@ -164,7 +163,7 @@ def main(timer: aoc.Timer) -> None:
     # good enogh for me.
     state = ((), 0, 0)
     height = 0
-    for _ in tqdm(range(int(total / stepsize))):
+    for _ in aoc.progress(range(int(total / stepsize)), name="Steps"):
         state, delta_height = simulate_pieces(stepsize, state)
         height += delta_height
     print(height)
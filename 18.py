@@ -1,22 +1,26 @@
 #! /usr/bin/env python3
 
-from queue import Queue
+from typing import Iterator
 
 import aoc
 
 DIRECTIONS = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
 
 
-def main(timer: aoc.Timer) -> None:
-    positions: list[tuple[int, int, int]] = [
-        tuple(line)
-        for line in aoc.Parse().regex_lines("(\d+),(\d+),(\d+)", (int, int, int)).get()
-    ]
-    world = [
+@aoc.cached_parse
+def build_world() -> list[list[list[bool]]]:
+    positions: set[tuple[int, int, int]] = set(
+        map(tuple, aoc.Parse().regex_lines(r"(\d+),(\d+),(\d+)", (int, int, int)).get())
+    )
+    return [
         [[(x, y, z) in positions for z in range(22)] for y in range(22)]
         for x in range(22)
     ]
 
+
+def main(timer: aoc.Timer) -> None:
+    world = build_world()
+
     print(
         sum(
             world[x][y][z] and not world[x + dx][y + dy][z + dz]
@@ -29,24 +33,25 @@ def main(timer: aoc.Timer) -> None:
 
     timer.mark()
 
-    queue = Queue()
-    queue.put((-1, -1, -1))
-    found: set[tuple[int, int, int]] = set()
-    found_faces = 0
+    def inside(x: int, y: int, z: int) -> bool:
+        return -1 <= x <= 21 and -1 <= y <= 21 and -1 <= z <= 21
 
-    while queue.qsize():
-        x, y, z = position = queue.get()
-        if position in found:
-            continue
-        found.add(position)
+    def neighbors(position: tuple[int, int, int]) -> Iterator[tuple[int, int, int]]:
+        x, y, z = position
         for dx, dy, dz in DIRECTIONS:
-            x_, y_, z_ = next_position = x + dx, y + dy, z + dz
-            if -1 <= x_ <= 21 and -1 <= y_ <= 21 and -1 <= z_ <= 21:
-                if world[x_][y_][z_]:
-                    found_faces += 1
-                else:
-                    queue.put(next_position)
-    print(found_faces)
+            x_, y_, z_ = x + dx, y + dy, z + dz
+            if inside(x_, y_, z_) and not world[x_][y_][z_]:
+                yield x_, y_, z_
+
+    outside = aoc.flood_fill([(-1, -1, -1)], neighbors)
+    print(
+        sum(
+            world[x + dx][y + dy][z + dz]
+            for x, y, z in outside
+            for dx, dy, dz in DIRECTIONS
+            if inside(x + dx, y + dy, z + dz)
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -9,7 +9,6 @@ from functools import cache, reduce
 
 import aoc
 from cached_property import cached_property
-from joblib import Parallel, delayed
 
 mul = lambda l: reduce((lambda x, y: x * y), l)
 
@@ -198,12 +197,10 @@ def main(timer: aoc.Timer) -> None:
 
     print(
         sum(
-            Parallel(n_jobs=8)(
-                delayed(
-                    lambda b: ideal_outcome(State(b.blueprint_number), 24)
-                    * b.blueprint_number
-                )(blueprint)
-                for blueprint in blueprints
+            aoc.pmap(
+                lambda b: ideal_outcome(State(b.blueprint_number), 24)
+                * b.blueprint_number,
+                blueprints,
             )
         )
     )
@@ -212,11 +209,8 @@ def main(timer: aoc.Timer) -> None:
 
     print(
         mul(
-            Parallel(n_jobs=8)(
-                delayed(lambda b: ideal_outcome(State(b.blueprint_number), 32))(
-                    blueprint
-                )
-                for blueprint in blueprints[:3]
+            aoc.pmap(
+                lambda b: ideal_outcome(State(b.blueprint_number), 32), blueprints[:3]
             )
         )
     )
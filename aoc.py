@@ -12,18 +12,29 @@ Files will be downloaded to a directory named `input` in the same directory as
 your main Python script. It will be created if it does not exist. For every day
 the script downloads the input and returns it from there. You don't need to
 manually call code to download the file, it will just happen automatically the
-first time you request anything for that day. All you have to do is call one
-of the following lines:
+first time you request anything for that day. On a new checkout all inputs can
+be downloaded concurrently up front with aoc.prefetch(). All you have to do is
+call one of the following lines:
 
     aoc.get(1) # bytes data for day one
     aoc.get_str(1) # string data for day one
     aoc.get_lines(1) # input lines for day one
     aoc.get_integers(1) # integers for day one (one per line)
     aoc.get_comma_integers(1) # get one line of integers separated by commas
-    aoc.get_dense_int_matrix(1) # get a 2d matrix of ints with one per character
+    aoc.get_dense_int_matrix(1) # get a 2d uint8 array with one int per character
+    aoc.get_char_grid(1) # get a 2d uint8 array with one byte per character
+    aoc.Grid.from_input(1) # get a padded flat grid with one byte per character
+    aoc.get_view(1) # zero-copy memoryview of the memory mapped input
+    aoc.get_line_views(1) # zero-copy memoryview per line
+    aoc.iter_lines(1) # lazily read input lines for day one
+    aoc.iter_blocks(1) # lazily read lists of lines separated by empty lines
 
     aoc.get_integers() # when called from `01-minimal.py` gets ints for day 1.
 
+Parsing that is slow can be cached on disk, read the documentation for
+cached_parse below. Inputs of arbitrary size can be generated to see how the
+solutions scale, read the documentation for generate and scaling below.
+
 You can also leave out the number and it will get guessed from the file name of
 the main Python file by just taking all the numbers in the file name. So for
 example `day_03.py` or `03-alternate.py` would query day 3; however files like
@@ -31,7 +42,8 @@ example `day_03.py` or `03-alternate.py` would query day 3; however files like
 what you want. You can rewrite that method, rename your files, or specify the
 day manually.
 
-Complex queries are possible, read the documentation for Parse below.
+Complex queries are possible, read the documentation for Parse below. For
+inputs that do not fit into memory use StreamParse instead.
 
     foo, bar = aoc.Parse().comma_integers().regex_lines(r"(\d+) => (.+)", (int, str))
 
@@ -47,34 +59,78 @@ and write a list of integers into foo, and a list of tuples, here [(1, "a"),
 (2, "b"), ...] into bar.
 
 This module also provides timer functionality. Read the documentation for Timer
-below.
+and benchmark below. Whole days can be benchmarked or profiled from the command
+line, see
+
+    python3 aoc.py --help
 
 Attributes:
+    ACTIVE_TIMERS (list[Timer]): The currently running Timers, innermost last.
+    ARRAY_TYPECODES (dict[Callable, str]): array.array types for columns.
+    BASELINE_FILE (Path): The stored results to compare benchmarks against.
+    BENCHMARK_DIRECTORY (Path): The directory to write benchmark results to.
     CACHE_DIRECTORY (Path): The directory to put the daily inputs in.
     CACHE_FILE_NAME_TEMPLATE (str): The name template for daily cache files.
     COOKIE_PATH (Path): The computed path to the cookie file.
+    CURRENT_DAY (int | None): Overrides the guessed day, set by as_day.
+    GENERATORS (dict[int, Callable]): The synthetic input generator per day.
+    MAPPINGS (dict[int, tuple[tuple[int, int], mmap.mmap]]): Memory mapped
+        cache files per day with the state of the file they were mapped from.
+    MEMO (OrderedDict[tuple, any]): Memoized inputs, least recently used first.
+    MEMO_SIZE (int): The maximum amount of memoized inputs.
     MOCKS (dict[int | None, bytes]): Mocked inputs for testing.
+    PMAP_TASK (tuple[Callable, list] | None): The function and items of the
+        running pmap, inherited by its worker processes.
+    PARSED_DIRECTORY (Path): The directory to cache parsed inputs in.
+    PROFILE_DIRECTORY (Path): The directory to write section profiles to.
     PROJECT_FOLDER (Path): The computed directory the main file is in.
     URL (str): A format url for a given day.
+    VECTORIZE_FROM_BYTES (int): The input size from which days switch to their
+        NumPy paths. Below it importing NumPy takes longer than the whole day.
 """
 
 from __future__ import annotations
 
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import mmap
+import os
+import random
 import re
 import sys
+import threading
 import time
-from itertools import pairwise
+from array import array
+from collections import OrderedDict, deque
+from functools import wraps
+from itertools import chain, pairwise
 from pathlib import Path
-from typing import Callable, Iterator
+from types import ModuleType
+from typing import Callable, Iterable, Iterator, TextIO
 
-import requests
+# Slow to import modules like requests are only imported in the functions that
+# need them to keep the startup of short days fast.
 
 PROJECT_FOLDER = Path(sys.argv[0]).parent
 COOKIE_PATH = PROJECT_FOLDER / "COOKIE.txt"
 URL = "https://adventofcode.com/2022/day/{}/input"
 CACHE_FILE_NAME_TEMPLATE = "{:02d}.txt"
 CACHE_DIRECTORY = PROJECT_FOLDER / "input"
+PARSED_DIRECTORY = CACHE_DIRECTORY / "parsed"
+BENCHMARK_DIRECTORY = PROJECT_FOLDER / "benchmarks"
+BASELINE_FILE = BENCHMARK_DIRECTORY / "baseline.json"
+PROFILE_DIRECTORY = PROJECT_FOLDER / "profiles"
+MAPPINGS: dict[int, tuple[tuple[int, int], mmap.mmap]] = {}
+MEMO: OrderedDict[tuple, any] = OrderedDict()
+MEMO_SIZE = 32
 MOCKS: dict[int | None, bytes] = {}
+CURRENT_DAY: int | None = None
+PMAP_TASK: tuple[Callable, list] | None = None
+VECTORIZE_FROM_BYTES = 4 << 20
+ACTIVE_TIMERS: list[Timer] = []
 
 # ==============================================================================
 # General functions to interface with AOC and fetch files
@@ -92,27 +148,113 @@ def cache_file_for_day(day: int) -> Path:
     return CACHE_DIRECTORY / CACHE_FILE_NAME_TEMPLATE.format(day)
 
 
+def write_atomically(path: Path, data: bytes) -> None:
+    """Write a file so that readers never see it partially written.
+
+    The data is written to a temporary file next to it which is then moved in
+    place. The file keeps its permissions if it exists and otherwise gets the
+    default ones of the umask.
+
+    Args:
+        path (Path): The file to write.
+        data (bytes): The content.
+    """
+    import secrets
+
+    # Creating the file with os.open lets the kernel apply the umask, reading
+    # it would mean changing it for every thread of the process.
+    temporary = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    descriptor = os.open(temporary, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        if path.exists():
+            os.chmod(temporary, path.stat().st_mode & 0o777)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def download(day: int, session: requests.Session | None = None) -> None:
+    """Download the input for a given day into its cache file.
+
+    Args:
+        day (int): The day number.
+        session (requests.Session | None, optional): The session to reuse the
+            connections of, otherwise a new connection is opened.
+    """
+    import requests
+
+    cookies = (
+        {"session": COOKIE_PATH.read_text().strip()} if COOKIE_PATH.exists() else {}
+    )
+    response = (session or requests).get(URL.format(day), cookies=cookies, timeout=30)
+    response.raise_for_status()
+    CACHE_DIRECTORY.mkdir(exist_ok=True)
+    write_atomically(cache_file_for_day(day), response.content)
+
+
 def ensure_downloaded(day: int) -> None:
     """Ensure the input for a given day is downloaded.
 
     Args:
         day (int): The day number.
     """
-    cache_file = cache_file_for_day(day)
-    if not cache_file.exists():
-        cookies = {"session": COOKIE_PATH.read_text().strip()}
-        CACHE_DIRECTORY.mkdir(exist_ok=True)
-        cache_file.write_bytes(requests.get(URL.format(day), cookies=cookies).content)
+    if not cache_file_for_day(day).exists():
+        download(day)
+
+
+def prefetch(days: list[int] | None = None, jobs: int = 8) -> list[int]:
+    """Download the inputs of all missing days concurrently.
+
+    All downloads share one session so connections are reused, and at most
+    jobs of them run at the same time. Days that fail to download are reported
+    and skipped without affecting the others.
+
+    Args:
+        days (list[int] | None, optional): The days to fetch, by default all 25.
+        jobs (int, optional): The maximum amount of concurrent downloads.
+
+    Returns:
+        list[int]: The days that were downloaded.
+    """
+    import concurrent.futures
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    missing = [
+        day for day in days or range(1, 26) if not cache_file_for_day(day).exists()
+    ]
+    if not missing:
+        return []
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=jobs)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+            futures = {day: executor.submit(download, day, session) for day in missing}
+    downloaded: list[int] = []
+    for day, future in futures.items():
+        if (error := future.exception()) is not None:
+            print(f"Day {day} failed: {error!r}")
+        else:
+            downloaded.append(day)
+    return downloaded
 
 
 def guess_day_from_filename() -> int:
     """Compute the day from the main filename.
 
-    Every digit character is put together and converted to integer.
+    Every digit character is put together and converted to integer. Inside of
+    as_day the day given there is returned instead.
 
     Returns:
         int: The guessed day.
     """
+    if CURRENT_DAY is not None:
+        return CURRENT_DAY
     filename = Path(sys.argv[0]).name
     return int("".join([letter for letter in filename if letter.isdigit()]))
 
@@ -132,10 +274,98 @@ def get(day: int | None = None) -> bytes:
     if (mocked := MOCKS.get(None)) is not None:
         return mocked
     day = day or guess_day_from_filename()
+    if (mocked := MOCKS.get(day)) is not None:
+        return mocked
+    return memoize("bytes", day, lambda day: cache_file_for_day(day).read_bytes())
+
+
+def get_buffer(day: int | None = None) -> bytes | mmap.mmap:
+    """Get a bytes-like input for a specified day without copying it.
+
+    The cache file is memory mapped once per process and the mapping is reused
+    for every following call, until the file is replaced or modified. Mocked
+    inputs are returned as they are.
+
+    Inputs are written by replacing the file, so an old mapping keeps its
+    content. A file rewritten in place can change under an existing mapping.
+
+    Args:
+        day (int | None, optional): The day number.
+
+    Returns:
+        bytes | mmap.mmap: The input for the day. Both support slicing, find
+            and the buffer protocol.
+    """
+    if (mocked := MOCKS.get(None)) is not None:
+        return mocked
+    day = day or guess_day_from_filename()
     if (mocked := MOCKS.get(day)) is not None:
         return mocked
     ensure_downloaded(day)
-    return cache_file_for_day(day).read_bytes()
+    state = _file_state(day)
+    if (mapped := MAPPINGS.get(day)) is not None and mapped[0] == state:
+        return mapped[1]
+    # Outdated mappings are only dropped, views of them may still be in use
+    MAPPINGS.pop(day, None)
+    with cache_file_for_day(day).open("rb") as file:
+        state = _file_state(day, os.fstat(file.fileno()))
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can not be mapped
+            return b""
+    MAPPINGS[day] = (state, mapping)
+    return mapping
+
+
+def _file_state(day: int, stat: os.stat_result | None = None) -> tuple[int, int]:
+    """The modification time and inode of the cache file of a day.
+
+    Together they change both when the file is modified and when it is
+    replaced, even within the timestamp resolution of the file system.
+    """
+    stat = stat or cache_file_for_day(day).stat()
+    return (stat.st_mtime_ns, stat.st_ino)
+
+
+def get_view(day: int | None = None) -> memoryview:
+    """Get a zero-copy memoryview of the input for a specified day.
+
+    If no day is specified it will try to guess from your file name by grabbing
+    all of the integers.
+
+    Args:
+        day (int | None, optional): The day number.
+
+    Returns:
+        memoryview: The input for the day.
+    """
+    return memoryview(get_buffer(day))
+
+
+def get_line_views(day: int | None = None) -> list[memoryview]:
+    """Get one zero-copy memoryview per line for a specified day.
+
+    Unlike get_lines only trailing whitespace of the whole input is removed,
+    leading whitespace of the first line is kept.
+
+    Args:
+        day (int | None, optional): The day number.
+
+    Returns:
+        list[memoryview]: The lines. Use bytes(line) to copy one out.
+    """
+    buffer = get_buffer(day)
+    view = memoryview(buffer)
+    end = len(buffer)
+    while end and buffer[end - 1] in b" \t\r\n":
+        end -= 1
+    line_views: list[memoryview] = []
+    start = 0
+    while (newline := buffer.find(b"\n", start, end)) != -1:
+        line_views.append(view[start:newline])
+        start = newline + 1
+    line_views.append(view[start:end])
+    return line_views
 
 
 def get_str(day: int | None = None) -> str:
@@ -150,7 +380,7 @@ def get_str(day: int | None = None) -> str:
     Returns:
         str: The input for the day.
     """
-    return get(day).decode("utf8")
+    return memoize("str", day, lambda day: str(get_view(day), "utf8"))
 
 
 def get_lines(day: int | None = None) -> list[str]:
@@ -165,7 +395,235 @@ def get_lines(day: int | None = None) -> list[str]:
     Returns:
         list[str]: The lines.
     """
-    return get_str(day).strip().split("\n")
+    return list(_get_shared_lines(day))
+
+
+def _get_shared_lines(day: int | None = None) -> list[str]:
+    """Like get_lines but returns the memoized list itself. Do not modify it."""
+    return memoize("lines", day, lambda day: get_str(day).strip().split("\n"))
+
+
+# ==============================================================================
+# Streaming inputs
+
+
+def open_input(day: int | None = None) -> TextIO:
+    """Open the input of a specified day as a text file.
+
+    Args:
+        day (int | None, optional): The day number.
+
+    Returns:
+        TextIO: The opened input. Mocked inputs are wrapped in memory.
+    """
+    if (mocked := MOCKS.get(None)) is not None:
+        return io.StringIO(mocked.decode("utf8"))
+    day = day or guess_day_from_filename()
+    if (mocked := MOCKS.get(day)) is not None:
+        return io.StringIO(mocked.decode("utf8"))
+    ensure_downloaded(day)
+    return cache_file_for_day(day).open(encoding="utf8")
+
+
+def iter_lines(day: int | None = None) -> Iterator[str]:
+    """Lazily yield one string per line for a specified day.
+
+    Only the current line is held in memory so this works for inputs of any
+    size. Like get_lines trailing empty lines are dropped.
+
+    Args:
+        day (int | None, optional): The day number.
+
+    Yields:
+        str: The lines without their line break.
+    """
+    with open_input(day) as file:
+        held_back_empty_lines = 0
+        for line in file:
+            if not (line := line.rstrip("\n")):
+                held_back_empty_lines += 1
+                continue
+            for _ in range(held_back_empty_lines):
+                yield ""
+            held_back_empty_lines = 0
+            yield line
+
+
+def iter_blocks(day: int | None = None) -> Iterator[list[str]]:
+    """Lazily yield blocks of lines separated by empty lines.
+
+    Only the current block is held in memory.
+
+    Args:
+        day (int | None, optional): The day number.
+
+    Yields:
+        list[str]: The lines of one block.
+    """
+    with open_input(day) as file:
+        block: list[str] = []
+        for line in file:
+            if line := line.rstrip("\n"):
+                block.append(line)
+            elif block:
+                yield block
+                block = []
+        if block:
+            yield block
+
+
+# ==============================================================================
+# Memoizing inputs
+
+
+def _input_key(day: int | None) -> tuple[int | None, bytes | tuple[int, int]]:
+    """Compute what identifies the current input of a day.
+
+    Mocks take precedence and are identified by their content. Cache files are
+    identified by their modification time and inode, like the memory mappings
+    of get_buffer.
+
+    Args:
+        day (int | None): The day number.
+
+    Returns:
+        tuple[int | None, bytes | tuple[int, int]]: The day and the
+            identifying state.
+    """
+    if (mocked := MOCKS.get(None)) is not None:
+        return (None, mocked)
+    day = day or guess_day_from_filename()
+    if (mocked := MOCKS.get(day)) is not None:
+        return (day, mocked)
+    ensure_downloaded(day)
+    return (day, _file_state(day))
+
+
+def memoize(kind: str, day: int | None, compute: Callable[[int], any]) -> any:
+    """Memoize a value derived from the input of a day for this process.
+
+    The memo is keyed by the kind, the day and the state of the input (mock or
+    cache file modification time and inode) so changed inputs are recomputed. Only the
+    MEMO_SIZE most recently used values are kept.
+
+    Args:
+        kind (str): The name of the derived value, e.g. "lines".
+        day (int | None): The day number.
+        compute (Callable[[int], any]): Computes the value for a given day.
+
+    Returns:
+        any: The memoized value. It is shared so it must not be modified.
+    """
+    input_day, state = _input_key(day)
+    key = (kind, input_day, state)
+    if key in MEMO:
+        MEMO.move_to_end(key)
+        return MEMO[key]
+    value = MEMO[key] = compute(input_day)
+    while len(MEMO) > MEMO_SIZE:
+        MEMO.popitem(last=False)
+    return value
+
+
+def clear_memo(day: int | None = None) -> None:
+    """Forget memoized inputs and memory mappings.
+
+    Args:
+        day (int | None, optional): The day to forget; otherwise forget all.
+    """
+    if day is None:
+        MEMO.clear()
+        MAPPINGS.clear()
+        return
+    for key in [key for key in MEMO if key[1] == day]:
+        del MEMO[key]
+    MAPPINGS.pop(day, None)
+
+
+# ==============================================================================
+# Caching parsed inputs on disk
+
+
+def disk_cache(spec: str, day: int | None, compute: Callable[[int], any]) -> any:
+    """Cache a value parsed from the input of a day on disk.
+
+    The value is pickled to PARSED_DIRECTORY, one file per day and spec. The
+    file starts with a hash of the input so it is recomputed automatically when
+    the input changes. Mocked inputs are never cached.
+
+    Args:
+        spec (str): Identifies how the value is parsed. Changing the parsing
+            code must change the spec.
+        day (int | None): The day number.
+        compute (Callable[[int], any]): Parses the value for a given day.
+
+    Returns:
+        any: The parsed value.
+    """
+    import hashlib
+    import pickle
+
+    day = day or guess_day_from_filename()
+    if MOCKS.get(None) is not None or MOCKS.get(day) is not None:
+        return compute(day)
+    input_hash = hashlib.blake2b(get_view(day)).digest()
+    spec_hash = hashlib.blake2b(spec.encode("utf8"), digest_size=8).hexdigest()
+    path = PARSED_DIRECTORY / f"{day:02d}-{spec_hash}.pickle"
+    try:
+        with path.open("rb") as file:
+            if file.read(len(input_hash)) == input_hash:
+                return pickle.load(file)
+    except Exception:  # Missing or unreadable cache files are just recomputed
+        pass
+    value = compute(day)
+    PARSED_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    write_atomically(
+        path, input_hash + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    return value
+
+
+def cached_parse(function: Callable[[], any]) -> Callable[[], any]:
+    """Decorate a parse function to cache its result on disk.
+
+        @aoc.cached_parse
+        def parse() -> set[tuple[int, int]]:
+            return {tuple(map(int, line.split(","))) for line in aoc.get_lines()}
+
+    The cache is keyed by the input of the guessed day and the source code of
+    the function, so editing the function invalidates it. The result must be
+    picklable. Read the documentation for disk_cache above.
+
+    Args:
+        function (Callable[[], any]): Parses the input of the guessed day.
+
+    Returns:
+        Callable[[], any]: The cached function.
+    """
+
+    @wraps(function)
+    def cached() -> any:
+        import inspect
+
+        try:
+            source = inspect.getsource(function)
+        except OSError:  # Defined interactively
+            source = ""
+        spec = f"{function.__module__}.{function.__qualname__}\n{source}"
+        return disk_cache(spec, None, lambda day: function())
+
+    return cached
+
+
+def clear_disk_cache(day: int | None = None) -> None:
+    """Delete parsed inputs cached on disk.
+
+    Args:
+        day (int | None, optional): The day to delete; otherwise delete all.
+    """
+    pattern = "*.pickle" if day is None else f"{day:02d}-*.pickle"
+    for path in PARSED_DIRECTORY.glob(pattern):
+        path.unlink()
 
 
 # ==============================================================================
@@ -179,9 +637,23 @@ def mock_bytes(data: bytes, day: int | None = None) -> None:
         content (str): The mocked bytes message.
         day (int | None, optional): The day to mock for; otherwise mock all.
     """
+    unmock(day)
     MOCKS[day] = data
 
 
+def unmock(day: int | None = None) -> None:
+    """Remove the mock of a day and forget everything memoized from it.
+
+    Args:
+        day (int | None, optional): The day to unmock; otherwise the mock of
+            all days.
+    """
+    if (mocked := MOCKS.pop(day, None)) is None:
+        return
+    for key in [key for key in MEMO if key[1] == day and key[2] is mocked]:
+        del MEMO[key]
+
+
 def mock(content: str, day: int | None = None) -> None:
     """Mock a string content for a given day or any.
 
@@ -192,10 +664,124 @@ def mock(content: str, day: int | None = None) -> None:
     mock_bytes(content.encode("utf8"), day)
 
 
+# ==============================================================================
+# Serving inputs locally
+
+
+@contextlib.contextmanager
+def fixture_server(directory: Path | None = None, scale: int = 1000) -> Iterator[str]:
+    """Serve inputs from a local stand-in for the aoc server.
+
+    While active URL points to the server so downloads can be tested and
+    benchmarked offline. Remember to point CACHE_DIRECTORY somewhere else to
+    not mix the served inputs with real ones.
+
+        with aoc.fixture_server(Path("fixtures")):
+            aoc.prefetch([1, 2, 3])
+
+    Args:
+        directory (Path | None, optional): The directory with the fixture files,
+            named like the cache files. Days without one are served generated
+            inputs, read the documentation for generate below.
+        scale (int, optional): The scale of the generated inputs.
+
+    Yields:
+        str: The format url of the server.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep connections alive like the real one
+
+        def do_GET(self) -> None:
+            if (match := re.fullmatch(r"/2022/day/(\d+)/input", self.path)) is None:
+                self.send_error(404)
+                return
+            day = int(match[1])
+            fixture = directory and directory / CACHE_FILE_NAME_TEMPLATE.format(day)
+            if fixture and fixture.exists():
+                body = fixture.read_bytes()
+            elif day in GENERATORS:
+                body = generate(day, scale)
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # Don't clutter the output with every request
+
+    global URL
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    previous_url = URL
+    URL = f"http://127.0.0.1:{server.server_port}/2022/day/{{}}/input"
+    try:
+        yield URL
+    finally:
+        URL = previous_url
+        server.shutdown()
+        server.server_close()
+
+
 # ==============================================================================
 # Getting complex queries
 
 
+def optional_numpy() -> any:
+    """Import NumPy if it is installed.
+
+    Returns:
+        module | None: The numpy module or None if it is not available.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+ARRAY_TYPECODES: dict[Callable, str] = {int: "q", float: "d"}
+
+
+def to_column(values: list[any], data_type: Callable) -> any:
+    """Pack a column of converted values into a compact typed array.
+
+    Integer and float columns become NumPy arrays if NumPy is installed and
+    array.array otherwise. Both can be iterated like lists and support tolist.
+    Columns of any other type stay lists.
+
+    Args:
+        values (list[any]): The already converted values.
+        data_type (Callable): The type they were converted with.
+
+    Returns:
+        numpy.ndarray | array.array | list: The column.
+    """
+    if (typecode := ARRAY_TYPECODES.get(data_type)) is None:
+        return values
+    if (numpy := optional_numpy()) is not None:
+        return numpy.array(values, dtype=numpy.int64 if data_type is int else float)
+    return array(typecode, values)
+
+
+def _parse_step(method: Callable) -> Callable:
+    """Record calls of a Parse method instead of running them if it is cached."""
+
+    @wraps(method)
+    def step(self: Parse, *args, **kwargs) -> Parse:
+        if self.steps is None:
+            return method(self, *args, **kwargs)
+        self.steps.append((method.__name__, args, kwargs))
+        return self
+
+    return step
+
+
 class Parse:
     """Do complex parses of multiple different blocks if necessary.
 
@@ -220,52 +806,116 @@ class Parse:
 
     Parse can be supplied with an optional day in the constructor.
 
+    With cached set the parsed sections are cached on disk, keyed by the input
+    and the chain of calls. The calls are only recorded and the input is parsed
+    or loaded when the sections are first accessed. The arguments of the calls,
+    including data types, must have a stable repr to identify the chain.
+
+        foo, bar = aoc.Parse(cached=True).integers().regex_lines(...)
+
     Attributes:
-        buffer (str): The buffer of the remaining input.
+        alt (str | None): The alternative input to parse instead of the day.
+        buffer (list[str]): All lines of the input. It is never modified,
+            reading only advances the cursor.
+        cursor (int): The index of the next unread line in the buffer.
         day (int): The observed day.
         sections (list): The sections that have already been parsed.
+        steps (list[tuple] | None): The recorded calls if cached and not parsed
+            yet, otherwise None.
     """
 
+    alt: str | None
+    buffer: list[str]
+    cursor: int
     day: int
     sections: list[any]
-    buffer: str
+    steps: list[tuple[str, tuple, dict]] | None
 
-    def __init__(self, day: int | None = None, alt: str | None = None):
+    def __init__(
+        self, day: int | None = None, alt: str | None = None, cached: bool = False
+    ):
         self.day = day or guess_day_from_filename()
         self.sections = []
-        self.buffer = get_lines(self.day) if alt is None else alt.split("\n")
+        self.alt = alt
+        self.steps = [] if cached else None
+        if cached:
+            self.buffer = []
+        else:
+            self.buffer = (
+                _get_shared_lines(self.day) if alt is None else alt.split("\n")
+            )
+        self.cursor = 0
 
     def __iter__(self) -> Iterator[any]:
+        self._resolve()
         return iter(self.sections)
 
     def __getitem__(self, key: int) -> any:
+        self._resolve()
         return self.sections[key]
 
     def get(self) -> any:
         """Get the single first item that has already been parsed."""
+        self._resolve()
         assert len(self.sections) == 1
         return self.sections[0]
 
+    def _resolve(self) -> None:
+        """Run the recorded calls or load their result from the disk cache."""
+        if self.steps is None:
+            return
+        steps, self.steps = self.steps, None
+
+        def compute(day: int) -> list[any]:
+            parse = Parse(day, self.alt)
+            for name, args, kwargs in steps:
+                getattr(parse, name)(*args, **kwargs)
+            return parse.sections
+
+        if self.alt is not None:
+            self.sections = compute(self.day)
+        else:
+            self.sections = disk_cache(f"Parse{steps!r}", self.day, compute)
+
+    def _next_line(self) -> str:
+        """Consume a single line."""
+        if self.cursor >= len(self.buffer):
+            raise IndexError("No lines left to parse")
+        self.cursor += 1
+        return self.buffer[self.cursor - 1]
+
+    def _next_section(self) -> list[str]:
+        """Consume lines until and including the next empty one."""
+        try:
+            end = self.buffer.index("", self.cursor)
+        except ValueError:
+            end = len(self.buffer)
+        section = self.buffer[self.cursor : end]
+        self.cursor = end + 1
+        return section
+
     def _remove_trailing_next(self) -> None:
         """Remove the next line if it is empty."""
-        if self.buffer and (self.buffer[0] == ""):
-            self.buffer.pop(0)
+        if self.cursor < len(self.buffer) and self.buffer[self.cursor] == "":
+            self.cursor += 1
 
+    @_parse_step
     def line(self) -> Parse:
         """Gets a single line."""
-        self.sections.append(self.buffer.pop(0))
+        self.sections.append(self._next_line())
         self._remove_trailing_next()
         return self
 
+    @_parse_step
     def lines(self) -> Parse:
         """Gets a list of lines until one is empty."""
-        current_section: list[str] = []
-        while self.buffer and (line := self.buffer.pop(0)):
-            current_section.append(line)
-        self.sections.append(current_section)
+        self.sections.append(self._next_section())
         return self
 
-    def regex_lines(self, query: str, data_types: list[Callable]) -> Parse:
+    @_parse_step
+    def regex_lines(
+        self, query: str, data_types: list[Callable], columnar: bool = False
+    ) -> Parse:
         """Match a list of lines until one is empty to regex and convert them
         to given data types.
 
@@ -282,43 +932,78 @@ class Parse:
         And write it into foo as a list of tuples looking like [(1, "a"),
         (2, "b"), (3, "c")].
 
+        Every column is converted at once. A ValueError is raised for lines
+        that do not match.
+
+        With columnar set it instead writes one column per group, here
+        ([1, 2, 3], ["a", "b", "c"]), packed into typed arrays where possible.
+        Read the documentation of to_column below.
+
         Args:
             query (str): The regex query.
             data_types (list[Callable]): The datatype conversion.
+            columnar (bool, optional): Return a tuple of columns instead of rows.
         """
+        first_line_number = self.cursor + 1
         self.lines()
+        section = self.sections[-1]
         pattern = re.compile(query)
-        self.sections[-1] = [
-            [
-                dtype(match)
-                for match, dtype in zip(pattern.match(line).groups(), data_types)
-            ]
-            for line in self.sections[-1]
+        rows = []
+        for line_number, line in enumerate(section, first_line_number):
+            if (match := pattern.match(line)) is None:
+                raise ValueError(
+                    f"Line {line_number} does not match {query!r}: {line!r}"
+                )
+            rows.append(match.groups())
+        raw_columns = list(zip(*rows)) if rows else [()] * len(data_types)
+        columns = [
+            list(map(dtype, column)) for column, dtype in zip(raw_columns, data_types)
         ]
+        if columnar:
+            self.sections[-1] = tuple(
+                to_column(column, dtype) for column, dtype in zip(columns, data_types)
+            )
+            return self
+        self.sections[-1] = (
+            [list(row) for row in zip(*columns)] if columns else [[] for _ in rows]
+        )
         return self
 
+    @_parse_step
     def regex_lines_single(self, query: str, data_type: Callable) -> Parse:
         """Like regex_lines but does not return a tuple but a single element."""
         self.regex_lines(query, [data_type])
         self.sections[-1] = [line[0] for line in self.sections[-1]]
         return self
 
-    def integers(self) -> Parse:
-        """Reads the lines as integers until there is an empty line."""
+    @_parse_step
+    def integers(self, columnar: bool = False) -> Parse:
+        """Reads the lines as integers until there is an empty line.
+
+        Args:
+            columnar (bool, optional): Pack them into a typed array.
+        """
         self.lines()
         self.sections[-1] = [int(line) for line in self.sections[-1]]
+        if columnar:
+            self.sections[-1] = to_column(self.sections[-1], int)
         return self
 
-    def comma_integers(self, separator=",") -> Parse:
+    @_parse_step
+    def comma_integers(self, separator=",", columnar: bool = False) -> Parse:
         """Reads a single line as comma separated integers.
 
         Args:
             separator (str, optional): The separator, by default ",".
+            columnar (bool, optional): Pack them into a typed array.
         """
-        self.sections.append([int(x) for x in self.buffer.pop(0).split(separator)])
+        self.sections.append([int(x) for x in self._next_line().split(separator)])
+        if columnar:
+            self.sections[-1] = to_column(self.sections[-1], int)
         self._remove_trailing_next()
         return self
 
+    @_parse_step
     def dense_int_matrix(self) -> Parse:
         """Read a dense integer matrix with one integer per character into a 2d
         array. For example
@@ -333,83 +1018,584 @@ class Parse:
         self.sections[-1] = [[int(char) for char in line] for line in self.sections[-1]]
         return self
 
+    @_parse_step
     def remaining_lines(self) -> Parse:
         """Put the remaining lines into the next variable for manual parsing."""
-        self.sections.append(self.buffer)
-        self.buffer = ""
+        self.sections.append(self.buffer[self.cursor :])
+        self.cursor = len(self.buffer)
         return self
 
 
-# ==============================================================================
-# Simple aliases
+class StreamParse(Parse):
+    """Parse an input lazily line by line.
 
-get_integers = lambda *args: Parse(*args).integers().get()
-get_comma_integers = lambda *args: Parse(*args).comma_integers().get()
-get_dense_int_matrix = lambda *args: Parse(*args).dense_int_matrix().get()
+    It has the same section methods as Parse but never loads the whole input.
+    Only the lines of the section currently being parsed are held in memory.
 
+        for line in aoc.StreamParse().integers().remaining_lines()[1]:
+            ...
 
-# ==============================================================================
-# Checks for --test command line argument
+    remaining_lines puts a lazy iterator into the next variable instead of a
+    list.
 
+    Attributes:
+        peeked (str | None): A line that has been read but not consumed yet.
+        stream (Iterator[str]): The lines that have not been read yet.
+    """
 
-def is_test() -> bool:
-    if "test" in sys.argv:
-        sys.argv.remove("test")
-        return True
-    return False
+    peeked: str | None
+    stream: Iterator[str]
 
+    def __init__(self, day: int | None = None, alt: str | None = None):
+        self.day = day or guess_day_from_filename()
+        self.sections = []
+        self.alt = alt
+        self.steps = None
+        self.buffer = []
+        self.cursor = 0
+        self.peeked = None
+        self.stream = iter_lines(self.day) if alt is None else iter(alt.split("\n"))
+
+    def _next_line(self) -> str:
+        """Consume a single line."""
+        if self.peeked is not None:
+            line, self.peeked = self.peeked, None
+        elif (line := next(self.stream, None)) is None:
+            raise IndexError("No lines left to parse")
+        self.cursor += 1
+        return line
+
+    def _next_section(self) -> list[str]:
+        """Consume lines until and including the next empty one."""
+        section: list[str] = []
+        while True:
+            try:
+                line = self._next_line()
+            except IndexError:
+                return section
+            if not line:
+                return section
+            section.append(line)
 
-# ==============================================================================
-# Timing code runtime
+    def _remove_trailing_next(self) -> None:
+        """Remove the next line if it is empty."""
+        if self.peeked is None:
+            self.peeked = next(self.stream, None)
+        if self.peeked == "":
+            self.peeked = None
+            self.cursor += 1
 
+    def remaining_lines(self) -> Parse:
+        """Put an iterator over the remaining lines into the next variable."""
+        if self.peeked is not None:
+            self.stream = chain([self.peeked], self.stream)
+            self.peeked = None
+        self.sections.append(self.stream)
+        self.stream = iter(())
+        return self
 
-class Timer:
-    """Used to time days.
 
-    Usage like:
+# ==============================================================================
+# Loading character grids
 
-        with aoc.Timer() as timer:
-            part1()
-            timer.mark()
-            part2()
 
-    It will automatically print a timed table. The initializer can get a custom
-    day name if you feel like it. If you don't call mark it will be timed as one
-    piece. I prefer to use it as
+def get_char_grid(day: int | None = None, offset: int = 0) -> numpy.ndarray:
+    """Get a contiguous 2d uint8 NumPy array with one cell per character.
 
-        import aoc
+    The array is built in one pass over the raw input bytes without splitting
+    them into lines first. For example
 
-        def main(timer: aoc.Timer) -> None:
-            # part 1 code
-            timer.mark()
-            # part 2 code
+        grid = aoc.get_char_grid(offset=ord("a"))
 
+    turns the lines "abc" and "bcd" into [[0, 1, 2], [1, 2, 3]]. Values below
+    the offset wrap around. This requires NumPy.
 
-        if __name__ == "__main__":
-            with aoc.Timer() as timer:
-                main(timer)
+    Args:
+        day (int | None, optional): The day number.
+        offset (int, optional): Subtracted from every byte, by default 0.
 
-    Mark can be used with a title too: mark("Fetching") to label the previous
-    section. The ones which you do not provide a title for will be labeled
-    "Part 1", "Part 2" and "Postprocessing" in order. The ones after will not
-    receive a label.
+    Returns:
+        numpy.ndarray: The grid indexed as grid[y, x].
     """
+    import numpy
+
+    buffer = get_buffer(day)
+    end = len(buffer)
+    while end and buffer[end - 1] in b" \t\r\n":
+        end -= 1
+    if (width := buffer.find(b"\n", 0, end)) == -1:
+        width = end
+    height = (end + 1) // (width + 1)
+    raw = numpy.frombuffer(buffer, dtype=numpy.uint8, count=end)
+    if height * (width + 1) - 1 != end or (raw[width :: width + 1] != 10).any():
+        raise ValueError("The lines of a character grid need to be of equal length")
+    cells = numpy.lib.stride_tricks.as_strided(
+        raw, shape=(height, width), strides=(width + 1, 1), writeable=False
+    )
+    return cells - numpy.uint8(offset)
+
+
+class Grid:
+    """A 2d grid of bytes stored row by row in one flat bytearray.
+
+    Cells are addressed by their flat index into cells, which turns moving to
+    a neighbour into adding one of the precomputed offsets. The grid is
+    surrounded by a border of one cell on every side, so neighbours of every
+    cell can be looked at without bounds checks; pick a border value that the
+    search treats as blocked. For example
+
+        grid = aoc.Grid.from_input(offset=ord("0"), border=255)
+        for index in grid.indices():
+            for offset in grid.offsets:
+                if grid.cells[index + offset] != 255:
+                    ...
+
+    visits the 4 neighbours of every cell that are in the grid.
 
-    times: list[float]
-    sections: list[str]
-    remaining_labels: list[str]
-    finished: bool = False
-    silent: bool = False
+    Attributes:
+        border (int): The value of the cells around the grid.
+        cells (bytearray): All cells including the border, row by row.
+        diagonal_offsets (tuple[int, ...]): The index offsets of all 8
+            neighbours, row by row.
+        height (int): The amount of rows without the border.
+        offsets (tuple[int, int, int, int]): The index offsets of the
+            neighbours above, left, right and below.
+        stride (int): The index offset between rows, the width plus border.
+        width (int): The amount of columns without the border.
+    """
 
-    day: str = ""
+    border: int
+    cells: bytearray
+    diagonal_offsets: tuple[int, ...]
+    height: int
+    offsets: tuple[int, int, int, int]
+    stride: int
+    width: int
+
+    def __init__(self, width: int, height: int, fill: int = 0, border: int = 0):
+        self.width, self.height = width, height
+        self.stride = width + 2
+        self.border = border
+        self.cells = bytearray([border]) * (self.stride * (height + 2))
+        for y in range(height):
+            self.row(y)[:] = bytes([fill]) * width
+        self.offsets = (-self.stride, -1, 1, self.stride)
+        self.diagonal_offsets = tuple(
+            dy * self.stride + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy
+        )
 
-    def __init__(self, day: any | None = None, silent: bool = False):
-        self.day = str(day) if day is not None else str(guess_day_from_filename())
-        self.remaining_labels = ["Part 1", "Part 2", "Postprocessing"]
-        self.times = []
-        self.sections = []
-        self.finished = False
+    @classmethod
+    def from_lines(
+        cls, lines: list[str | bytes | memoryview], offset: int = 0, border: int = 0
+    ) -> Grid:
+        """Build a grid with one cell per character of equally long lines.
+
+        Args:
+            lines (list[str | bytes | memoryview]): The rows.
+            offset (int, optional): Subtracted from every byte, by default 0.
+            border (int, optional): The value of the border, by default 0.
+
+        Returns:
+            Grid: The grid.
+        """
+        rows = [
+            line.encode("utf8") if isinstance(line, str) else line for line in lines
+        ]
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("The lines of a character grid need to be of equal length")
+        grid = cls(width, len(rows), border=border)
+        table = bytes((value - offset) % 256 for value in range(256))
+        for y, row in enumerate(rows):
+            grid.row(y)[:] = bytes(row).translate(table)
+        return grid
+
+    @classmethod
+    def from_input(
+        cls, day: int | None = None, offset: int = 0, border: int = 0
+    ) -> Grid:
+        """Build a grid with one cell per character of the input of a day.
+
+        Args:
+            day (int | None, optional): The day number.
+            offset (int, optional): Subtracted from every byte, by default 0.
+            border (int, optional): The value of the border, by default 0.
+
+        Returns:
+            Grid: The grid.
+        """
+        return cls.from_lines(get_line_views(day), offset, border)
+
+    def index(self, x: int, y: int) -> int:
+        """The flat index of a position, (-1, -1) is the top left border cell."""
+        return (y + 1) * self.stride + x + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """The x and y position of a flat index."""
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        return self.cells[self.index(*position)]
+
+    def __setitem__(self, position: tuple[int, int], value: int) -> None:
+        self.cells[self.index(*position)] = value
+
+    def row(self, y: int) -> memoryview:
+        """A writable view of the cells of a row without the border."""
+        start = self.index(0, y)
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        """A writable view of the cells of a column without the border."""
+        start = self.index(x, 0)
+        return memoryview(self.cells)[
+            start : start + self.height * self.stride : self.stride
+        ]
+
+    def indices(self) -> Iterator[int]:
+        """The flat indices of all cells without the border, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def moves(self, allowed: Callable[[int, int], bool]) -> Callable[[int], list[int]]:
+        """A neighbor function over flat indices for the graph searches.
+
+            climb = grid.moves(lambda here, there: there <= here + 1)
+
+        Args:
+            allowed (Callable[[int, int], bool]): Whether moving from a cell
+                with the first value to one with the second is possible. Moves
+                onto the border never are.
+
+        Returns:
+            Callable[[int], list[int]]: The neighbors that can be moved to from
+                a flat index.
+        """
+        cells, border, offsets = self.cells, self.border, self.offsets
+
+        def neighbors(index: int) -> list[int]:
+            here = cells[index]
+            return [
+                index + offset
+                for offset in offsets
+                if (there := cells[index + offset]) != border and allowed(here, there)
+            ]
+
+        return neighbors
+
+    def find(self, value: int) -> int:
+        """The flat index of the first cell with a value, ignoring the border."""
+        index = -1
+        while (index := self.cells.find(value, index + 1)) != -1:
+            x, y = self.position(index)
+            if 0 <= x < self.width and 0 <= y < self.height:
+                return index
+        raise ValueError(f"{value} is not in the grid")
+
+
+# ==============================================================================
+# Searching graphs
+
+
+def bfs(
+    starts: Iterable[any],
+    neighbors: Callable[[any], Iterable[any]],
+    goal: Callable[[any], bool],
+) -> int | None:
+    """Find the distance to the closest node matching a goal, breadth first.
+
+        distance = aoc.bfs([start], grid.moves(climbable), lambda i: i == end)
+
+    Nodes can be anything hashable, for example the flat indices of a Grid
+    with Grid.moves as the neighbor function. They are marked as visited when
+    they are queued so every node is queued at most once. The amount of
+    expanded nodes is counted on the current Timer.
+
+    Args:
+        starts (Iterable[any]): The nodes to start from, all at distance 0.
+        neighbors (Callable[[any], Iterable[any]]): The nodes reachable in one
+            step from a node.
+        goal (Callable[[any], bool]): Whether a node is a goal.
+
+    Returns:
+        int | None: The distance or None if no goal can be reached.
+    """
+    distances = dict.fromkeys(starts, 0)
+    queue = deque(distances)
+    expanded = 0
+    try:
+        while queue:
+            node = queue.popleft()
+            if goal(node):
+                return distances[node]
+            expanded += 1
+            distance = distances[node] + 1
+            for neighbor in neighbors(node):
+                if neighbor not in distances:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return None
+    finally:
+        count("BFS expanded", expanded)
+
+
+def bfs_distances(
+    starts: Iterable[any], neighbors: Callable[[any], Iterable[any]]
+) -> dict[any, int]:
+    """Find the distances to all reachable nodes, breadth first. See bfs.
+
+    Args:
+        starts (Iterable[any]): The nodes to start from, all at distance 0.
+        neighbors (Callable[[any], Iterable[any]]): The nodes reachable in one
+            step from a node.
+
+    Returns:
+        dict[any, int]: The distance of every reachable node.
+    """
+    distances = dict.fromkeys(starts, 0)
+    queue = deque(distances)
+    while queue:
+        node = queue.popleft()
+        distance = distances[node] + 1
+        for neighbor in neighbors(node):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                queue.append(neighbor)
+    count("BFS expanded", len(distances))
+    return distances
+
+
+def flood_fill(
+    starts: Iterable[any], neighbors: Callable[[any], Iterable[any]]
+) -> set[any]:
+    """Find all nodes reachable from the starts, in no particular order.
+
+    Args:
+        starts (Iterable[any]): The nodes to start from.
+        neighbors (Callable[[any], Iterable[any]]): The nodes reachable in one
+            step from a node.
+
+    Returns:
+        set[any]: The reachable nodes, including the starts.
+    """
+    reached = set(starts)
+    stack = list(reached)
+    while stack:
+        for neighbor in neighbors(stack.pop()):
+            if neighbor not in reached:
+                reached.add(neighbor)
+                stack.append(neighbor)
+    count("Flood fill expanded", len(reached))
+    return reached
+
+
+def dijkstra(
+    starts: Iterable[any],
+    neighbors: Callable[[any], Iterable[tuple[any, int]]],
+    goal: Callable[[any], bool],
+    heuristic: Callable[[any], int] | None = None,
+) -> int | None:
+    """Find the cost of the cheapest path to a node matching a goal.
+
+    With a heuristic that never overestimates the remaining cost this is A*.
+    The amount of expanded nodes is counted on the current Timer.
+
+    Args:
+        starts (Iterable[any]): The nodes to start from, all at cost 0.
+        neighbors (Callable[[any], Iterable[tuple[any, int]]]): The nodes
+            reachable in one step from a node and the cost of the step.
+        goal (Callable[[any], bool]): Whether a node is a goal.
+        heuristic (Callable[[any], int] | None, optional): A lower bound of the
+            remaining cost from a node to the goal.
+
+    Returns:
+        int | None: The cost or None if no goal can be reached.
+    """
+    import heapq
+
+    costs = dict.fromkeys(starts, 0)
+    # The counter breaks ties so nodes never have to be compared.
+    heap = [
+        (heuristic(node) if heuristic else 0, index, node)
+        for index, node in enumerate(costs)
+    ]
+    heapq.heapify(heap)
+    tiebreaker = len(heap)
+    expanded = 0
+    try:
+        while heap:
+            priority, _, node = heapq.heappop(heap)
+            cost = costs[node]
+            if priority > cost + (heuristic(node) if heuristic else 0):
+                continue  # Found a cheaper path after queueing this one
+            if goal(node):
+                return cost
+            expanded += 1
+            for neighbor, step in neighbors(node):
+                if (new_cost := cost + step) < costs.get(neighbor, math.inf):
+                    costs[neighbor] = new_cost
+                    estimate = new_cost + (heuristic(neighbor) if heuristic else 0)
+                    heapq.heappush(heap, (estimate, tiebreaker, neighbor))
+                    tiebreaker += 1
+        return None
+    finally:
+        count("Dijkstra expanded", expanded)
+
+
+def all_pairs_distances(
+    sources: Iterable[any],
+    neighbors: Callable[[any], Iterable[any]],
+    targets: Iterable[any] | None = None,
+) -> dict[any, dict[any, int]]:
+    """Find the distances between nodes with a breadth first search per source.
+
+    Args:
+        sources (Iterable[any]): The nodes to measure from.
+        neighbors (Callable[[any], Iterable[any]]): The nodes reachable in one
+            step from a node.
+        targets (Iterable[any] | None, optional): The nodes to keep the
+            distances to, by default all reachable ones.
+
+    Returns:
+        dict[any, dict[any, int]]: The distances from every source to every
+            reachable target, including the source itself if it is a target.
+    """
+    targets = None if targets is None else set(targets)
+    return {
+        source: {
+            node: distance
+            for node, distance in bfs_distances([source], neighbors).items()
+            if targets is None or node in targets
+        }
+        for source in sources
+    }
+
+
+# ==============================================================================
+# Simple aliases
+
+get_integers = lambda *args: Parse(*args).integers().get()
+get_comma_integers = lambda *args: Parse(*args).comma_integers().get()
+get_dense_int_matrix = lambda *args: get_char_grid(*args, offset=ord("0"))
+
+
+# ==============================================================================
+# Checks for --test command line argument
+
+
+def is_test() -> bool:
+    if "test" in sys.argv:
+        sys.argv.remove("test")
+        return True
+    return False
+
+
+# ==============================================================================
+# Timing code runtime
+
+
+class Timer:
+    """Used to time days.
+
+    Usage like:
+
+        with aoc.Timer() as timer:
+            part1()
+            timer.mark()
+            part2()
+
+    It will automatically print a timed table. The initializer can get a custom
+    day name if you feel like it. If you don't call mark it will be timed as one
+    piece. I prefer to use it as
+
+        import aoc
+
+        def main(timer: aoc.Timer) -> None:
+            # part 1 code
+            timer.mark()
+            # part 2 code
+
+
+        if __name__ == "__main__":
+            with aoc.Timer() as timer:
+                main(timer)
+
+    Mark can be used with a title too: mark("Fetching") to label the previous
+    section. The ones which you do not provide a title for will be labeled
+    "Part 1", "Part 2" and "Postprocessing" in order. The ones after will not
+    receive a label.
+
+    With profile=True every section is run under its own cProfile profiler.
+    The stats are written to PROFILE_DIRECTORY as one .pstats file per section
+    named after it and the most expensive calls are printed below the table.
+
+    With memory=True the peak of memory allocated by Python (via tracemalloc)
+    and the growth of the peak resident set size of the process are recorded
+    per section. Tracing allocations slows the code down noticeably.
+
+    Inside of sections nested spans can be timed with span, either as a context
+    manager or as a decorator:
+
+        with timer.span("Precompute"):
+            ...
+
+        @timer.span("Search")
+        def search() -> int:
+            ...
+
+    Spans and sections can be exported for chrome://tracing or Perfetto with
+    export_chrome_trace or automatically on exit with trace="trace.json". The
+    tasks of pmap are recorded as spans too, in the process they ran in.
+
+    Loops wrapped in progress report their throughput to the running Timer,
+    which is printed below the table. So are counters like the amount of nodes
+    the graph searches expanded, which can be added to with count.
+    """
+
+    times: list[int]
+    sections: list[str]
+    remaining_labels: list[str]
+    finished: bool = False
+    silent: bool = False
+    profile: bool = False
+    profilers: list[cProfile.Profile]
+    memory: bool = False
+    memory_usages: list[tuple[int, int | None]]
+    started_tracing: bool = False
+    last_max_rss: int | None = None
+    spans: list[dict[str, any]]
+    span_depth: int = 0
+    throughputs: list[dict[str, any]]
+    counters: dict[str, int]
+    trace: Path | None = None
+
+    day: str = ""
+
+    def __init__(
+        self,
+        day: any | None = None,
+        silent: bool = False,
+        profile: bool = False,
+        memory: bool = False,
+        trace: Path | str | None = None,
+    ):
+        self.day = str(day) if day is not None else str(guess_day_from_filename())
+        self.remaining_labels = ["Part 1", "Part 2", "Postprocessing"]
+        self.times = []
+        self.sections = []
+        self.finished = False
         self.silent = silent
+        self.profile = profile
+        self.profilers = []
+        self.memory = memory
+        self.memory_usages = []
+        self.spans = []
+        self.span_depth = 0
+        self.throughputs = []
+        self.counters = {}
+        self.trace = None if trace is None else Path(trace)
 
     def next_label(self) -> str:
         """Get the next automatically computed label
@@ -420,8 +1606,188 @@ class Timer:
         """
         return self.remaining_labels.pop(0) if self.remaining_labels else ""
 
+    @property
+    def durations(self) -> list[tuple[str, int]]:
+        """The label and duration in nanoseconds of every finished section."""
+        return [
+            (label, time_b - time_a)
+            for (time_a, time_b), label in zip(pairwise(self.times), self.sections)
+        ]
+
+    @property
+    def total(self) -> int:
+        """The total duration of all finished sections in nanoseconds."""
+        return self.times[-1] - self.times[0]
+
+    def as_dict(self) -> dict[str, any]:
+        """The results in a form that can be serialized to JSON."""
+        results = {
+            "day": self.day,
+            "sections": [
+                {"name": label, "time_ns": duration}
+                for label, duration in self.durations
+            ],
+            "total_ns": self.total,
+        }
+        for section, (peak, rss_delta) in zip(results["sections"], self.memory_usages):
+            section["peak_alloc_bytes"] = peak
+            section["rss_delta_bytes"] = rss_delta
+        if self.throughputs:
+            results["throughputs"] = self.throughputs
+        if self.counters:
+            results["counters"] = self.counters
+        return results
+
+    def record_throughput(self, name: str, items: int, duration: int) -> None:
+        """Record how many items a loop went through in what time.
+
+        Args:
+            name (str): The name of the loop.
+            items (int): The amount of items.
+            duration (int): The time it took in nanoseconds.
+        """
+        self.throughputs.append({"name": name, "items": items, "time_ns": duration})
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a named counter, e.g. of expanded nodes.
+
+        Args:
+            name (str): The name of the counter.
+            amount (int, optional): The amount to add, by default 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def _measure_memory(self, first: bool = False) -> None:
+        """Record the memory usage of the section that just ended.
+
+        Args:
+            first (bool, optional): No section ended yet, just start measuring.
+        """
+        if not self.memory:
+            return
+        import tracemalloc
+
+        if first and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        if not first:
+            max_rss = max_rss_bytes()
+            self.memory_usages.append(
+                (
+                    tracemalloc.get_traced_memory()[1],
+                    None if max_rss is None else max_rss - self.last_max_rss,
+                )
+            )
+        tracemalloc.reset_peak()
+        self.last_max_rss = max_rss_bytes()
+
+    def _memory_cells(self, index: int | None = None) -> list[str]:
+        """Format the memory usage of a section, or the total, for the table."""
+        if not self.memory:
+            return []
+        if index is not None:
+            peak, rss_delta = self.memory_usages[index]
+        else:
+            peak = max(peak for peak, _ in self.memory_usages)
+            rss_deltas = [rss_delta for _, rss_delta in self.memory_usages]
+            rss_delta = None if None in rss_deltas else sum(rss_deltas)
+        return [
+            format_bytes(peak),
+            "" if rss_delta is None else format_bytes(rss_delta),
+        ]
+
+    def _switch_profiler(self, start_next: bool = True) -> None:
+        """Stop profiling the current section and start with the next one."""
+        if not self.profile:
+            return
+        if self.profilers:
+            self.profilers[-1].disable()
+        if start_next:
+            import cProfile
+
+            self.profilers.append(cProfile.Profile())
+            self.profilers[-1].enable()
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a nested span inside of a section.
+
+        Args:
+            name (str): The name of the span.
+        """
+        start = time.perf_counter_ns()
+        self.span_depth += 1
+        try:
+            yield
+        finally:
+            self.span_depth -= 1
+            self.spans.append(
+                {
+                    "name": name,
+                    "start_ns": start,
+                    "end_ns": time.perf_counter_ns(),
+                    "depth": self.span_depth,
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                }
+            )
+
+    def chrome_trace(self) -> dict[str, any]:
+        """The sections and spans in the Chrome trace event format.
+
+        Returns:
+            dict[str, any]: The trace, ready to be serialized to JSON.
+        """
+        origin = self.times[0]
+        pid = os.getpid()
+        sections = [
+            {
+                "name": label or f"Section {index}",
+                "start_ns": time_a,
+                "end_ns": time_b,
+                "pid": pid,
+                "tid": threading.get_native_id(),
+                "cat": "section",
+            }
+            for index, ((time_a, time_b), label) in enumerate(
+                zip(pairwise(self.times), self.sections), 1
+            )
+        ]
+        events = [
+            {
+                "name": span["name"],
+                "cat": span.get("cat", "span"),
+                "ph": "X",
+                "ts": (span["start_ns"] - origin) / 1000,
+                "dur": (span["end_ns"] - span["start_ns"]) / 1000,
+                "pid": span["pid"],
+                "tid": span["tid"],
+            }
+            for span in sections + self.spans
+        ]
+        events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": f"Day {self.day}"},
+            }
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Path | str) -> None:
+        """Write the sections and spans as a Chrome trace event JSON file.
+
+        Args:
+            path (Path | str): The file to write.
+        """
+        Path(path).write_text(json.dumps(self.chrome_trace()))
+
     def __enter__(self) -> Timer:
-        self.times = [time.time()]
+        ACTIVE_TIMERS.append(self)
+        self._switch_profiler()
+        self._measure_memory(first=True)
+        self.times = [time.perf_counter_ns()]
         return self
 
     def mark(self, name: str = None) -> None:
@@ -430,8 +1796,10 @@ class Timer:
         Args:
             name (str, optional): The name of the section. Autolabeled usually.
         """
-        self.times.append(time.time())
+        self.times.append(time.perf_counter_ns())
         self.sections.append(name or self.next_label())
+        self._measure_memory()
+        self._switch_profiler()
 
     def last_mark(self, name: str = None) -> None:
         """Mark the end current part or section. Don't start a sequence after.
@@ -443,44 +1811,1329 @@ class Timer:
         self.finished = True
 
     def __exit__(self, exception_type, exception_value, traceback) -> None:
+        ACTIVE_TIMERS.remove(self)
         if not self.finished:
-            self.times.append(time.time())
+            self.times.append(time.perf_counter_ns())
             self.sections.append(self.next_label())
+            self._measure_memory()
+        self._switch_profiler(start_next=False)
+        if self.profile:
+            self.dump_profiles()
+        if self.started_tracing:
+            import tracemalloc
+
+            tracemalloc.stop()
+        if self.trace is not None:
+            self.export_chrome_trace(self.trace)
 
         if self.silent or exception_type is not None:
             return
 
-        self.times = [1000 * t for t in self.times]
+        rows = [
+            (label, [format_ns(duration), *self._memory_cells(index)])
+            for index, (label, duration) in enumerate(self.durations)
+        ]
+        print_table(
+            self.day,
+            rows if len(rows) > 1 else [],
+            [format_ns(self.total), *self._memory_cells()],
+            headers=["Time", "Peak alloc", "RSS delta"] if self.memory else None,
+        )
+        for throughput in self.throughputs:
+            print(
+                f"{throughput['name'] or 'Progress'}: {throughput['items']} items in "
+                f"{format_ns(throughput['time_ns'])}, "
+                f"{format_rate(throughput['items'], throughput['time_ns'])}"
+            )
+        for name, amount in self.counters.items():
+            print(f"{name}: {amount}")
+        if self.profile:
+            self.print_profiles()
+
+    def profile_paths(self) -> list[Path]:
+        """The .pstats file of every profiled section, named like 16-2-reducing."""
+        return [
+            PROFILE_DIRECTORY / f"{self.day.zfill(2)}-{index}-{slugify(label)}.pstats"
+            for index, label in enumerate(self.sections, 1)
+        ]
 
-        label_length = max(len(label) for label in self.sections)
-        last_col_length = len(f"{self.times[-1] - self.times[0]:.03f}") + 3
+    def dump_profiles(self) -> None:
+        """Write the stats of every profiled section to PROFILE_DIRECTORY."""
+        PROFILE_DIRECTORY.mkdir(exist_ok=True)
+        for profiler, path in zip(self.profilers, self.profile_paths()):
+            profiler.dump_stats(path)
 
-        def separator(character: str, continuous: bool = True) -> str:
-            return (
-                (character * label_length)
-                + (character if continuous else " ") * 4
-                + (character * last_col_length)
-            )
+    def print_profiles(self, amount: int = 10) -> None:
+        """Print the most expensive calls of every profiled section.
+
+        Args:
+            amount (int, optional): The amount of calls per section.
+        """
+        import pstats
+
+        for profiler, label, path in zip(
+            self.profilers, self.sections, self.profile_paths()
+        ):
+            print(f"\n{label or 'Unlabeled section'} ({path})")
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(amount)
+
+
+def current_timer() -> Timer | None:
+    """Get the innermost Timer that is currently running, if any."""
+    return ACTIVE_TIMERS[-1] if ACTIVE_TIMERS else None
+
+
+@contextlib.contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a nested span on the current Timer, see Timer.span.
+
+    This is for code that has no access to the timer. Without a running Timer
+    it does nothing.
 
-        toprule = separator("━")
-        midrule = separator("─")
-        bottomrule = toprule
+    Args:
+        name (str): The name of the span.
+    """
+    if (timer := current_timer()) is None:
+        yield
+        return
+    with timer.span(name):
+        yield
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add to a counter of the current Timer, see Timer.count.
 
-        print(toprule)
-        print(f"{'Day'.ljust(label_length)}    {self.day.rjust(last_col_length)}")
+    Without a running Timer it does nothing.
+
+    Args:
+        name (str): The name of the counter.
+        amount (int, optional): The amount to add, by default 1.
+    """
+    if (timer := current_timer()) is not None:
+        timer.count(name, amount)
+
+
+def slugify(label: str) -> str:
+    """Turn a section label into something usable in file names."""
+    return re.sub(r"\W+", "-", label).strip("-").lower()
+
+
+def max_rss_bytes() -> int | None:
+    """The peak resident set size of this process so far in bytes.
+
+    Returns:
+        int | None: The size or None where the resource module is unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def format_bytes(size: float) -> str:
+    """Format a memory size in bytes for the tables."""
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_ns(duration: float) -> str:
+    """Format a duration in nanoseconds as milliseconds for the tables."""
+    return f"{duration / 1_000_000:.03f} ms"
+
+
+def format_rate(items: int, duration: int) -> str:
+    """Format the throughput of items in a duration in nanoseconds."""
+    return f"{items * 1e9 / duration if duration else 0.0:,.0f} items/s"
+
+
+def print_table(
+    day: str,
+    rows: list[tuple[str, list[str]]],
+    total: list[str],
+    headers: list[str] | None = None,
+) -> None:
+    """Print a table in the style of the Timer.
+
+    Args:
+        day (str): The day shown at the top.
+        rows (list[tuple[str, list[str]]]): The label and cells of every row.
+            The section is left out if there are no rows.
+        total (list[str]): The cells of the total row at the bottom.
+        headers (list[str] | None, optional): Column headers. Without them the
+            day is shown in the first column.
+    """
+    title = "Day" if headers is None else f"Day {day}"
+    label_length = max(len(label) for label in [title, "Total", *(r[0] for r in rows)])
+    column_lengths = [
+        max(len(cell) for cell in column)
+        for column in zip(
+            *(cells for _, cells in rows),
+            total,
+            headers or [day, *[""] * (len(total) - 1)],
+        )
+    ]
+
+    def line(label: str, cells: list[str]) -> str:
+        return label.ljust(label_length) + "".join(
+            "    " + cell.rjust(length) for cell, length in zip(cells, column_lengths)
+        )
+
+    toprule = "━" * len(line("", total))
+    midrule = "─" * len(toprule)
+
+    print(toprule)
+    print(line(title, headers or [day, *[""] * (len(total) - 1)]))
+    print(midrule)
+    if rows:
+        for label, cells in rows:
+            print(line(label, cells))
         print(midrule)
-        if len(self.times) > 2:
-            for (time_a, time_b), label in zip(pairwise(self.times), self.sections):
-                print(
-                    label.ljust(label_length)
-                    + "    "
-                    + f"{time_b - time_a:.03f} ms".rjust(last_col_length)
+    print(line("Total", total))
+    print(toprule)
+
+
+# ==============================================================================
+# Reporting progress
+
+
+def progress(
+    iterable: Iterable[any],
+    total: int | None = None,
+    name: str = "",
+    interval: float = 0.2,
+) -> Iterator[any]:
+    """Show the progress of a long loop on stderr, a light replacement for tqdm.
+
+        for state in aoc.progress(states, name="Search"):
+            ...
+
+    The clock is only looked at every so many items, which is adjusted to
+    about 16 times per interval, and the line is only redrawn once per
+    interval. Loops that end within the first interval print nothing. The
+    throughput is reported to the running Timer at the end.
+
+    In benchmark mode, that is under a silent Timer as used by benchmark, bench
+    and run-all, the items are passed through untouched without any overhead.
+
+    Args:
+        iterable (Iterable[any]): The items to loop over.
+        total (int | None, optional): The amount of items, by default their
+            length if they have one.
+        name (str, optional): The name shown in front of the progress.
+        interval (float, optional): The seconds between redraws.
+
+    Yields:
+        any: The items.
+    """
+    timer = current_timer()
+    if timer is not None and timer.silent:
+        yield from iterable
+        return
+    if total is None and hasattr(iterable, "__len__"):
+        total = len(iterable)
+    interval_ns = int(interval * 1e9)
+    start = checked = time.perf_counter_ns()
+    next_draw = start + interval_ns
+    count = 0
+    stride = next_check = 1
+    drawn = False
+    try:
+        for item in iterable:
+            yield item
+            count += 1
+            if count < next_check:
+                continue
+            now = time.perf_counter_ns()
+            if now - checked < interval_ns // 16:
+                stride *= 2
+            elif now - checked > interval_ns // 4 and stride > 1:
+                stride //= 2
+            checked = now
+            next_check = count + stride
+            if now >= next_draw:
+                draw_progress(name, count, total, now - start)
+                next_draw = now + interval_ns
+                drawn = True
+    finally:
+        duration = time.perf_counter_ns() - start
+        if drawn:
+            draw_progress(name, count, total, duration)
+            sys.stderr.write("\n")
+        if timer is not None:
+            timer.record_throughput(name, count, duration)
+
+
+def draw_progress(name: str, count: int, total: int | None, duration: int) -> None:
+    """Redraw the progress line on stderr.
+
+    Args:
+        name (str): The name shown in front.
+        count (int): The amount of items done.
+        total (int | None): The amount of items if known.
+        duration (int): The time since the start in nanoseconds.
+    """
+    done = f"{count}/{total} ({count / total:.0%})" if total else str(count)
+    prefix = f"{name}: " if name else ""
+    # \033[K clears the rest of the line in case the last one was longer.
+    sys.stderr.write(f"\r{prefix}{done}, {format_rate(count, duration)}\033[K")
+    sys.stderr.flush()
+
+
+# ==============================================================================
+# Benchmarking code runtime
+
+STATISTICS = ["min_ns", "median_ns", "p95_ns", "stdev_ns"]
+
+
+def benchmark(
+    main: Callable[[Timer], None],
+    runs: int = 10,
+    warmup: int = 2,
+    day: any | None = None,
+    silent: bool = False,
+) -> dict[str, any]:
+    """Time a day repeatedly and report statistics for every section.
+
+    Use it instead of the Timer in your main block like
+
+        if __name__ == "__main__":
+            aoc.benchmark(main, runs=20)
+
+    main is run warmup + runs times with silent Timers and its printed output
+    is swallowed. The warmup runs are discarded. The memo and memory mappings
+    are cleared before every run so each one reads and splits the input again,
+    only parses cached on disk with cached_parse are reused. For every section and the
+    total it prints the minimum, median, 95th percentile and standard deviation
+    and writes the results as JSON to BENCHMARK_DIRECTORY.
+
+    Args:
+        main (Callable[[Timer], None]): The function to time.
+        runs (int, optional): The amount of timed runs.
+        warmup (int, optional): The amount of untimed runs before.
+        day (any | None, optional): The day name, guessed by default.
+        silent (bool, optional): Don't print the table or write the file.
+
+    Returns:
+        dict[str, any]: The results as they are written to the JSON file.
+    """
+    day = str(day) if day is not None else str(guess_day_from_filename())
+    timers: list[Timer] = []
+    for run in range(warmup + runs):
+        clear_memo()
+        with (
+            contextlib.redirect_stdout(io.StringIO()),
+            Timer(day, silent=True) as timer,
+        ):
+            main(timer)
+        if run >= warmup:
+            timers.append(timer)
+
+    labels = [label for label, _ in timers[0].durations]
+    samples = [
+        [timer.durations[index][1] for timer in timers] for index in range(len(labels))
+    ]
+    results = {
+        "day": day,
+        "runs": runs,
+        "warmup": warmup,
+        "sections": [
+            {"name": label, **statistics_ns(section_samples)}
+            for label, section_samples in zip(labels, samples)
+        ],
+        "total": statistics_ns([timer.total for timer in timers]),
+    }
+    if silent:
+        return results
+
+    def cells(stats: dict[str, any]) -> list[str]:
+        return [format_ns(stats[key]) for key in STATISTICS]
+
+    rows = [(section["name"], cells(section)) for section in results["sections"]]
+    print_table(
+        day,
+        rows if len(rows) > 1 else [],
+        cells(results["total"]),
+        headers=[key.removesuffix("_ns").capitalize() for key in STATISTICS],
+    )
+    BENCHMARK_DIRECTORY.mkdir(exist_ok=True)
+    json_path = BENCHMARK_DIRECTORY / f"{day.zfill(2)}.json"
+    json_path.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {json_path}")
+    return results
+
+
+def statistics_ns(samples: list[int]) -> dict[str, any]:
+    """Compute the benchmark statistics of a list of nanosecond durations.
+
+    Args:
+        samples (list[int]): The durations.
+
+    Returns:
+        dict[str, any]: The STATISTICS and the samples themselves.
+    """
+    import statistics
+
+    return {
+        "min_ns": min(samples),
+        "median_ns": statistics.median(samples),
+        "p95_ns": (
+            statistics.quantiles(samples, n=20, method="inclusive")[-1]
+            if len(samples) > 1
+            else samples[0]
+        ),
+        "stdev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples_ns": samples,
+    }
+
+
+# ==============================================================================
+# Running whole days in process
+
+
+@contextlib.contextmanager
+def as_day(day: int) -> Iterator[None]:
+    """Make every function that guesses the day use the given one instead.
+
+    Args:
+        day (int): The day number.
+    """
+    global CURRENT_DAY
+    previous_day, CURRENT_DAY = CURRENT_DAY, day
+    try:
+        yield
+    finally:
+        CURRENT_DAY = previous_day
+
+
+def find_days() -> dict[int, Path]:
+    """Find the day scripts named like 01.py next to the main script.
+
+    Returns:
+        dict[int, Path]: The script of every day, ordered by day.
+    """
+    return {
+        int(path.stem): path for path in sorted(PROJECT_FOLDER.glob("[0-9][0-9].py"))
+    }
+
+
+def load_day(day: int) -> ModuleType:
+    """Import the script of a day without running its main block.
+
+    Args:
+        day (int): The day number.
+
+    Returns:
+        ModuleType: The imported script. Its main function is module.main.
+    """
+    path = find_days()[day]
+    specification = importlib.util.spec_from_file_location(f"day_{path.stem}", path)
+    module = importlib.util.module_from_spec(specification)
+    sys.modules[specification.name] = module  # Needed to resolve dataclasses
+    with as_day(day):
+        specification.loader.exec_module(module)
+    return module
+
+
+# ==============================================================================
+# Benchmarking all days against a baseline
+
+
+def measure_imports(day: int) -> int:
+    """Measure how long importing a day script takes in a fresh interpreter.
+
+    The script is imported with python -X importtime and the top level imports
+    it triggers, aoc included, are summed up.
+
+    Args:
+        day (int): The day number.
+
+    Returns:
+        int: The import time in nanoseconds.
+    """
+    import subprocess
+
+    code = (
+        "import runpy, sys; sys.stderr.write('--- day ---\\n');"
+        "runpy.run_path(sys.argv[1], run_name='imports_only')"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, str(find_days()[day])],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_FOLDER,
+    )
+    if process.returncode:
+        raise RuntimeError(f"Importing day {day} failed:\n{process.stderr[-500:]}")
+    import_lines = process.stderr.split("--- day ---\n", 1)[-1].splitlines()
+    # Lines look like "import time: 123 | 4567 | package" with the package
+    # indented by two more spaces for every level of nesting.
+    return 1000 * sum(
+        int(fields[1])
+        for line in import_lines
+        if len(fields := line.split("|")) == 3
+        and fields[2].startswith(" ")
+        and not fields[2].startswith("  ")
+        and fields[1].strip().isdigit()
+    )
+
+
+def section_keys(results: dict[str, any]) -> dict[str, dict[str, any]]:
+    """Key the sections of benchmark results by label, or position if unlabeled.
+
+    Args:
+        results (dict[str, any]): Results as returned by benchmark.
+
+    Returns:
+        dict[str, dict[str, any]]: The statistics of the imports if measured,
+            every section and "Total".
+    """
+    return (
+        ({"Imports": results["imports"]} if "imports" in results else {})
+        | {
+            section["name"] or f"#{index + 1}": section
+            for index, section in enumerate(results["sections"])
+        }
+        | {"Total": results["total"]}
+    )
+
+
+def bench(
+    days: list[int] | None = None,
+    runs: int = 5,
+    warmup: int = 1,
+    threshold: float = 0.1,
+    save: bool = False,
+) -> bool:
+    """Benchmark the main function of every day script and compare to a baseline.
+
+    Each day is imported and run in this process with silent Timers. The time
+    it takes to import each script in a fresh interpreter is measured as well
+    and reported as "Imports". The fastest run of every section is compared to
+    the baseline stored in BASELINE_FILE. Sections are flagged if they got
+    slower by more than the threshold and every run was slower than every
+    baseline run, so noise alone does not fail the check.
+
+    Args:
+        days (list[int] | None, optional): The days to run, by default all.
+        runs (int, optional): The amount of timed runs per day.
+        warmup (int, optional): The amount of untimed runs per day before.
+        threshold (float, optional): The allowed relative slowdown.
+        save (bool, optional): Store the results as the new baseline.
+
+    Returns:
+        bool: Whether no section got slower than allowed and no day failed.
+    """
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    passed = True
+    for day, path in find_days().items():
+        if days and day not in days:
+            continue
+        try:
+            module = load_day(day)
+            with as_day(day):
+                results = benchmark(module.main, runs, warmup, day, silent=True)
+            results["imports"] = statistics_ns(
+                [measure_imports(day) for _ in range(runs)]
+            )
+        except Exception as error:  # Keep going to get results for the others
+            print(f"Day {day} failed: {error!r}\n")
+            passed = False
+            continue
+
+        previous = section_keys(baseline.get(str(day), {"sections": [], "total": {}}))
+        rows: list[tuple[str, list[str]]] = []
+        for key, section in section_keys(results).items():
+            fastest = section["min_ns"]
+            if not (old := previous.get(key)):
+                rows.append((key, [format_ns(fastest), "", ""]))
+                continue
+            old_fastest = old["min_ns"]
+            change = (fastest - old_fastest) / old_fastest if old_fastest else 0.0
+            regressed = change > threshold and fastest > max(old["samples_ns"])
+            passed = passed and not regressed
+            rows.append(
+                (
+                    key,
+                    [
+                        format_ns(fastest),
+                        format_ns(old_fastest),
+                        f"{change:+.1%}" + (" SLOWER" if regressed else ""),
+                    ],
                 )
-            print(midrule)
-        print(
-            "Total".ljust(label_length)
-            + "    "
-            + f"{self.times[-1] - self.times[0]:.03f} ms".rjust(last_col_length)
+            )
+        print_table(
+            str(day), rows[:-1], rows[-1][1], headers=["Min", "Baseline", "Change"]
         )
+        print()
+        baseline[str(day)] = results if save else baseline.get(str(day), results)
+
+    if save:
+        BENCHMARK_DIRECTORY.mkdir(exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2))
+        print(f"Baseline written to {BASELINE_FILE}")
+    return passed
+
+
+# ==============================================================================
+# Generating synthetic inputs
+
+GENERATORS: dict[int, Callable[[random.Random, int], str]] = {}
+
+
+def generator(day: int) -> Callable[[Callable], Callable]:
+    """Register a function as the input generator of a day.
+
+    Args:
+        day (int): The day number.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+    """
+
+    def register(function: Callable[[random.Random, int], str]) -> Callable:
+        GENERATORS[day] = function
+        return function
+
+    return register
+
+
+def generate(day: int, scale: int, seed: int = 0) -> bytes:
+    """Generate a valid input of arbitrary size for a day.
+
+    What the scale counts depends on the day, e.g. elves for day 1 or sensors
+    for day 15, read the documentation of the generators below. The output is
+    deterministic for a given seed and can be injected with mock_bytes.
+
+        aoc.mock_bytes(aoc.generate(1, 1_000_000), 1)
+
+    Args:
+        day (int): The day number.
+        scale (int): The size of the input.
+        seed (int, optional): The seed of the random generator.
+
+    Returns:
+        bytes: The input, ending in a newline like the real ones.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"There is no input generator for day {day}")
+    return (GENERATORS[day](random.Random(seed), max(scale, 1)) + "\n").encode("utf8")
+
+
+@generator(1)
+def _generate_calories(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of elves."""
+    return "\n\n".join(
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 14)))
+        for _ in range(scale)
+    )
+
+
+@generator(2)
+def _generate_strategy_guide(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of rounds."""
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(scale))
+
+
+@generator(3)
+def _generate_rucksacks(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of rucksacks, rounded up to full groups of three.
+
+    Both halves of a rucksack share exactly one item and each group of three
+    shares exactly one badge.
+    """
+    import string
+
+    rucksacks: list[str] = []
+    for _ in range(-(-scale // 3)):
+        badge, *others = rng.sample(string.ascii_letters, 52)
+        for index in range(3):
+            # Every other item is missing from one rucksack of the group.
+            allowed = [item for i, item in enumerate(others) if i % 3 != index]
+            shared, *rest = rng.sample(allowed, len(allowed))
+            left_only, right_only = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+            size = rng.randint(4, 16)
+            left = [badge, shared, *rng.choices(left_only, k=size - 2)]
+            right = [shared, *rng.choices(right_only, k=size - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            rucksacks.append("".join(left + right))
+    return "\n".join(rucksacks)
+
 
-        print(bottomrule)
+@generator(4)
+def _generate_section_pairs(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of pairs."""
+
+    def assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "\n".join(f"{assignment()},{assignment()}" for _ in range(scale))
+
+
+@generator(5)
+def _generate_crane_procedure(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of moves. There are always nine stacks.
+
+    The moves are simulated so they never empty a stack.
+    """
+    import string
+
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(2, 8)) for _ in range(9)
+    ]
+    height = max(len(stack) for stack in stacks)
+    drawing = [
+        " ".join(f"[{stack[row]}]" if row < len(stack) else "   " for stack in stacks)
+        for row in range(height - 1, -1, -1)
+    ]
+    drawing.append(" ".join(f" {index} " for index in range(1, 10)))
+    moves: list[str] = []
+    for _ in range(scale):
+        source = rng.choice([i for i, stack in enumerate(stacks) if len(stack) > 1])
+        target = rng.choice([index for index in range(9) if index != source])
+        amount = rng.randint(1, len(stacks[source]) - 1)
+        stacks[target] += stacks[source][-amount:]
+        del stacks[source][-amount:]
+        moves.append(f"move {amount} from {source + 1} to {target + 1}")
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+@generator(6)
+def _generate_datastream(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of characters before the markers.
+
+    They are drawn from three letters so neither marker can appear earlier.
+    """
+    letters = rng.sample("abcdefghijklmnopqrstuvwxyz", 17)
+    return "".join(rng.choices(letters[:3], k=scale)) + "".join(letters[3:])
+
+
+@generator(7)
+def _generate_terminal_output(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of directories, nested up to 100 deep.
+
+    File sizes shrink with the scale so the disk is about as full as in the
+    real inputs and part 2 has to delete something.
+    """
+    children: list[list[int]] = [[]]
+    depths = [0]
+    for directory in range(1, scale):
+        # Prefer nesting into the newest directory to get deep trees.
+        parent = directory - 1 if rng.random() < 0.3 else rng.randrange(directory)
+        if depths[parent] >= 100:
+            parent = 0
+        children[parent].append(directory)
+        children.append([])
+        depths.append(depths[parent] + 1)
+
+    def name(index: int) -> str:
+        letters = ""
+        while True:
+            index, letter = divmod(index, 26)
+            letters += chr(ord("a") + letter)
+            if not index:
+                return letters
+
+    mean_size = max(2000, 45_000_000 // (2 * scale))
+    lines = ["$ cd /"]
+
+    def explore(directory: int) -> None:
+        lines.append("$ ls")
+        lines.extend(f"dir {name(child)}" for child in children[directory])
+        lines.extend(
+            f"{rng.randint(1, 2 * mean_size)} {name(index)}.{rng.choice(['txt', 'dat'])}"
+            for index in range(rng.randint(0, 4))
+        )
+        for child in children[directory]:
+            lines.append(f"$ cd {name(child)}")
+            explore(child)
+            lines.append("$ cd ..")
+
+    explore(0)
+    return "\n".join(lines)
+
+
+@generator(8)
+def _generate_tree_heights(rng: random.Random, scale: int) -> str:
+    """Scale is the width and height of the forest."""
+    return "\n".join("".join(rng.choices("0123456789", k=scale)) for _ in range(scale))
+
+
+@generator(9)
+def _generate_rope_motions(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of motions."""
+    return "\n".join(f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(scale))
+
+
+@generator(10)
+def _generate_cpu_program(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of instructions."""
+    return "\n".join(
+        "noop" if rng.random() < 0.3 else f"addx {rng.randint(-20, 20) or 1}"
+        for _ in range(scale)
+    )
+
+
+@generator(11)
+def _generate_monkeys(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of monkeys, at least two.
+
+    Each monkey tests for a different prime. There are no old * old operations
+    as with random throws they would make the worry levels of part 1 explode.
+    """
+    count = max(scale, 2)
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    rng.shuffle(primes)
+    monkeys: list[str] = []
+    for index, prime in enumerate(primes):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if rng.random() < 0.5:
+            operation = f"old + {rng.randint(1, 8)}"
+        else:
+            operation = f"old * {rng.randint(2, 19)}"
+        others = [other for other in range(count) if other != index]
+        targets = rng.choice(others), rng.choice(others)
+        monkeys.append(
+            f"Monkey {index}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {prime}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}"
+        )
+    return "\n\n".join(monkeys)
+
+
+@generator(12)
+def _generate_heightmap(rng: random.Random, scale: int) -> str:
+    """Scale is the width of the map, which is four times as wide as high.
+
+    The height rises evenly towards the end with random bumps that have to be
+    walked around. The top row and the last column have no bumps so the end is
+    always reachable.
+    """
+    width = max(scale, 30)
+    height = max(width // 4, 5)
+    rows: list[str] = []
+    for y in range(height):
+        row = ""
+        for x in range(width):
+            altitude = (x + y) * 25 // (width + height - 2)
+            if y and x < width - 1 and rng.random() < 0.15:
+                altitude = min(altitude + 2, 25)
+            row += chr(ord("a") + altitude)
+        rows.append(row)
+    rows[0] = "S" + rows[0][1:]
+    rows[-1] = rows[-1][:-1] + "E"
+    return "\n".join(rows)
+
+
+@generator(13)
+def _generate_packet_pairs(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of packet pairs."""
+
+    def packet(depth: int = 0) -> list:
+        return [
+            (
+                packet(depth + 1)
+                if depth < 4 and rng.random() < 0.3
+                else rng.randint(0, 10)
+            )
+            for _ in range(rng.randint(0, 5))
+        ]
+
+    return "\n\n".join(f"{packet()}\n{packet()}".replace(" ", "") for _ in range(scale))
+
+
+@generator(14)
+def _generate_rock_paths(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of rock paths. The cave gets deeper with more paths.
+
+    Rocks stay below the diagonals through the sand source, otherwise a cave
+    could fill up to the source without sand ever falling into the abyss.
+    """
+    depth = 10 + 5 * math.isqrt(scale)
+    paths: list[str] = []
+    for _ in range(scale):
+        y = rng.randint(2, depth)
+        x = 500 + rng.randint(2 - y, y - 2)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 5)):
+            step = rng.choice([-1, 1]) * rng.randint(1, 8)
+            if segment % 2:
+                y = max(abs(x - 500) + 2, y + step)
+            else:
+                x = 500 + max(2 - y, min(y - 2, x - 500 + step))
+            points.append((x, y))
+        paths.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(paths)
+
+
+@generator(15)
+def _generate_sensors(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of sensors, at least 8.
+
+    All sensors reach up to but not including one hidden point. Four of them
+    cover the cones left, right, above and below of it, four more the
+    diagonals, so it is the only possible position of the distress beacon.
+    """
+    hidden_x, hidden_y = rng.randint(0, 4_000_000), rng.randint(0, 4_000_000)
+    lines: list[str] = []
+
+    def add_sensor(x: int, y: int) -> None:
+        radius = abs(x - hidden_x) + abs(y - hidden_y) - 1
+        dx = rng.randint(-radius, radius)
+        dy = rng.choice([-1, 1]) * (radius - abs(dx))
+        lines.append(
+            f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}"
+        )
+
+    for sign in (-1, 1):
+        add_sensor(hidden_x + sign * 4_000_001, hidden_y)
+        add_sensor(hidden_x, hidden_y + sign * 4_000_001)
+        add_sensor(hidden_x + sign * 2_000_000, hidden_y + 2_000_000)
+        add_sensor(hidden_x + sign * 2_000_000, hidden_y - 2_000_000)
+    while len(lines) < scale:
+        x, y = rng.randint(-500_000, 4_500_000), rng.randint(-500_000, 4_500_000)
+        if abs(x - hidden_x) + abs(y - hidden_y) > 1:
+            add_sensor(x, y)
+    return "\n".join(lines)
+
+
+@generator(16)
+def _generate_valves(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of valves, a quarter of them have a flow rate.
+
+    The tunnels form a random connected graph starting at valve AA.
+    """
+    count = max(scale, 2)
+    length = 2
+    while 26**length < count:
+        length += 1
+    names = ["A" * length] + [
+        "".join(chr(ord("A") + (index // 26**power) % 26) for power in range(length))
+        for index in rng.sample(range(1, 26**length), count - 1)
+    ]
+    tunnels: list[set[int]] = [set() for _ in range(count)]
+    for index in range(1, count):
+        other = rng.randrange(index)
+        tunnels[index].add(other)
+        tunnels[other].add(index)
+    for _ in range(count // 3):
+        first, second = rng.sample(range(count), 2)
+        tunnels[first].add(second)
+        tunnels[second].add(first)
+    flowing = set(rng.sample(range(1, count), max(1, count // 4)))
+    lines: list[str] = []
+    for index, name in enumerate(names):
+        flow_rate = rng.randint(1, 25) if index in flowing else 0
+        targets = ", ".join(names[other] for other in sorted(tunnels[index]))
+        if len(tunnels[index]) == 1:
+            lines.append(
+                f"Valve {name} has flow rate={flow_rate}; tunnel leads to valve {targets}"
+            )
+        else:
+            lines.append(
+                f"Valve {name} has flow rate={flow_rate}; tunnels lead to valves {targets}"
+            )
+    return "\n".join(lines)
+
+
+@generator(17)
+def _generate_jet_pattern(rng: random.Random, scale: int) -> str:
+    """Scale is the length of the jet pattern."""
+    return "".join(rng.choices("<>", k=scale))
+
+
+@generator(18)
+def _generate_cubes(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of cubes, at most 9261 as coordinates go up to 20."""
+    return "\n".join(
+        f"{index // 441},{index // 21 % 21},{index % 21}"
+        for index in rng.sample(range(21**3), min(scale, 21**3))
+    )
+
+
+@generator(19)
+def _generate_blueprints(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of blueprints."""
+    return "\n".join(
+        f"Blueprint {number}: "
+        f"Each ore robot costs {rng.randint(2, 4)} ore. "
+        f"Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+        f"and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore "
+        f"and {rng.randint(5, 20)} obsidian."
+        for number in range(1, scale + 1)
+    )
+
+
+@generator(20)
+def _generate_encrypted_file(rng: random.Random, scale: int) -> str:
+    """Scale is the amount of numbers, at least two. Exactly one of them is zero.
+
+    With a single number the mixing would take every number modulo zero.
+    """
+    count = max(scale, 2)
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(count - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return "\n".join(map(str, numbers))
+
+
+def scaling(
+    day: int, scales: list[int], runs: int = 1, seed: int = 0
+) -> list[dict[str, any]]:
+    """Time a day on generated inputs of growing size.
+
+    The day is run in this process on inputs from generate, injected with
+    mock_bytes. For every scale the median total time is printed together with
+    the exponent k of the growth t ~ scale**k since the previous scale. The
+    results are written as JSON to BENCHMARK_DIRECTORY.
+
+    Args:
+        day (int): The day number.
+        scales (list[int]): The scales to generate inputs for.
+        runs (int, optional): The amount of timed runs per scale.
+        seed (int, optional): The seed of the input generator.
+
+    Returns:
+        list[dict[str, any]]: The benchmark results of every scale together
+            with the scale and the size of the input in bytes.
+    """
+    module = load_day(day)
+    results: list[dict[str, any]] = []
+    rows: list[tuple[str, list[str]]] = []
+    for size in sorted(set(scales)):
+        data = generate(day, size, seed)
+        mock_bytes(data, day)
+        try:
+            with as_day(day):
+                result = benchmark(module.main, runs, 0, day, silent=True)
+        finally:
+            unmock(day)
+        median = result["total"]["median_ns"]
+        exponent = ""
+        if results:
+            previous = results[-1]
+            growth = median / previous["total"]["median_ns"]
+            exponent = f"{math.log(growth) / math.log(size / previous['scale']):.2f}"
+        results.append({"scale": size, "bytes": len(data), **result})
+        rows.append((str(size), [format_bytes(len(data)), format_ns(median), exponent]))
+
+    print_table(
+        str(day),
+        rows,
+        ["", format_ns(sum(result["total"]["median_ns"] for result in results)), ""],
+        headers=["Input", "Median", "Exponent"],
+    )
+    BENCHMARK_DIRECTORY.mkdir(exist_ok=True)
+    json_path = BENCHMARK_DIRECTORY / f"{day:02d}-scaling.json"
+    json_path.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {json_path}")
+    return results
+
+
+# ==============================================================================
+# Running all days concurrently
+
+
+def run_day(day: int) -> tuple[int, str, dict[str, any] | None, str | None]:
+    """Run the main function of a day script capturing what it prints.
+
+    Args:
+        day (int): The day number.
+
+    Returns:
+        int: The day number.
+        str: The printed output.
+        dict[str, any] | None: The Timer results, see Timer.as_dict.
+        str | None: The error if the day failed.
+    """
+    output = io.StringIO()
+    try:
+        module = load_day(day)
+        with (
+            contextlib.redirect_stdout(output),
+            as_day(day),
+            Timer(day, silent=True) as timer,
+        ):
+            module.main(timer)
+    except Exception as error:  # Report it with the others
+        return day, output.getvalue(), None, repr(error)
+    return day, output.getvalue(), timer.as_dict(), None
+
+
+def run_all(days: list[int] | None = None, jobs: int | None = None) -> bool:
+    """Run the main function of every day script in a pool of processes.
+
+    Days are started longest first according to the median totals stored in
+    BASELINE_FILE, days without history first of all. The output and timings
+    of every day are printed together once all of them are done.
+
+    Args:
+        days (list[int] | None, optional): The days to run, by default all.
+        jobs (int | None, optional): The amount of processes, by default one
+            per core.
+
+    Returns:
+        bool: Whether all days succeeded.
+    """
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    days = [day for day in find_days() if not days or day in days]
+    days.sort(
+        key=lambda day: baseline.get(str(day), {})
+        .get("total", {})
+        .get("median_ns", math.inf),
+        reverse=True,
+    )
+
+    import concurrent.futures
+
+    start = time.perf_counter_ns()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = sorted(executor.map(run_day, days))
+    wall_time = time.perf_counter_ns() - start
+
+    succeeded = True
+    for day, output, timer_results, error in results:
+        print(f"Day {day}")
+        print(output, end="")
+        if error is not None:
+            print(f"Failed: {error}\n")
+            succeeded = False
+            continue
+        rows = [
+            (section["name"], [format_ns(section["time_ns"])])
+            for section in timer_results["sections"]
+        ]
+        print_table(
+            str(day),
+            rows if len(rows) > 1 else [],
+            [format_ns(timer_results["total_ns"])],
+        )
+        print()
+
+    totals = [
+        timer_results["total_ns"] for _, _, timer_results, _ in results if timer_results
+    ]
+    print(f"Wall time:   {format_ns(wall_time)}")
+    print(f"Summed days: {format_ns(sum(totals))}")
+    print(f"Slowest day: {format_ns(max(totals, default=0))}")
+    return succeeded
+
+
+# ==============================================================================
+# Parallel map
+
+
+def available_cores() -> int:
+    """The amount of cores this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def _run_tasks(indices: range) -> list[tuple[any, int, int, int, int]]:
+    """Apply the function of the running pmap to a chunk of its items.
+
+    Returns:
+        list[tuple[any, int, int, int, int]]: The result, start and end time,
+            process id and thread id of every task.
+    """
+    function, items = PMAP_TASK
+    process_id, thread_id = os.getpid(), threading.get_native_id()
+    results = []
+    for index in indices:
+        start = time.perf_counter_ns()
+        result = function(items[index])
+        results.append((result, start, time.perf_counter_ns(), process_id, thread_id))
+    return results
+
+
+def pmap(
+    function: Callable[[any], any],
+    items: Iterable[any],
+    jobs: int | None = None,
+    chunksize: int | None = None,
+) -> list[any]:
+    """Apply a function to every item in parallel processes.
+
+        scores = aoc.pmap(lambda blueprint: search(blueprint, 24), blueprints)
+
+    The worker processes are forked after the function and items are stored in
+    PMAP_TASK, so they do not need to be picklable and closures defined inside
+    of main work. Only the chunks of indices and the results are sent between
+    the processes. Where fork is not available the items are mapped in this
+    process instead.
+
+    Every task is recorded as a span on the current Timer with the process it
+    ran in, so they show up in its Chrome trace.
+
+    Args:
+        function (Callable[[any], any]): The function, results must be picklable.
+        items (Iterable[any]): The items to apply it to.
+        jobs (int | None, optional): The amount of processes, by default one per
+            available core.
+        chunksize (int | None, optional): The amount of items sent to a process
+            at once, by default enough for about four chunks per process.
+
+    Returns:
+        list[any]: The results in the order of the items.
+    """
+    import concurrent.futures
+    import multiprocessing
+
+    global PMAP_TASK
+    items = list(items)
+    jobs = max(1, min(jobs or available_cores(), len(items)))
+    chunksize = chunksize or max(1, math.ceil(len(items) / (4 * jobs)))
+    chunks = [
+        range(start, min(start + chunksize, len(items)))
+        for start in range(0, len(items), chunksize)
+    ]
+    previous_task, PMAP_TASK = PMAP_TASK, (function, items)
+    try:
+        if jobs == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            outcomes = list(map(_run_tasks, chunks))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                outcomes = list(executor.map(_run_tasks, chunks))
+    finally:
+        PMAP_TASK = previous_task
+
+    timer = current_timer()
+    name = getattr(function, "__name__", "task")
+    results: list[any] = []
+    for index, (result, start, end, process_id, thread_id) in enumerate(
+        chain.from_iterable(outcomes)
+    ):
+        results.append(result)
+        if timer is not None:
+            timer.spans.append(
+                {
+                    "name": f"{name} {index}",
+                    "cat": "task",
+                    "start_ns": start,
+                    "end_ns": end,
+                    "depth": timer.span_depth,
+                    "pid": process_id,
+                    "tid": thread_id,
+                }
+            )
+    return results
+
+
+# ==============================================================================
+# Command line interface
+
+
+def cli(arguments: list[str] | None = None) -> int:
+    """Run the command line interface, see python3 aoc.py --help.
+
+    Args:
+        arguments (list[str] | None, optional): The arguments, by default argv.
+
+    Returns:
+        int: The exit code.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="aoc.py", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prefetch_parser = commands.add_parser("prefetch", help="download missing inputs")
+    prefetch_parser.add_argument("days", type=int, nargs="*", help="default: all")
+    prefetch_parser.add_argument("--jobs", type=int, default=8)
+
+    bench_parser = commands.add_parser("bench", help="benchmark all days")
+    bench_parser.add_argument("days", type=int, nargs="*", help="default: all")
+    bench_parser.add_argument("--runs", type=int, default=5)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%"
+    )
+    bench_parser.add_argument(
+        "--save", action="store_true", help="store the results as the new baseline"
+    )
+
+    run_parser = commands.add_parser("run", help="run a day with instrumentation")
+    run_parser.add_argument("day", type=int)
+    run_parser.add_argument(
+        "--profile", action="store_true", help="profile every section"
+    )
+    run_parser.add_argument(
+        "--memory", action="store_true", help="record memory per section"
+    )
+    run_parser.add_argument("--trace", type=Path, help="write a Chrome trace file")
+
+    scale_parser = commands.add_parser("scale", help="time a day on generated inputs")
+    scale_parser.add_argument("day", type=int)
+    scale_parser.add_argument("scales", type=int, nargs="+")
+    scale_parser.add_argument("--runs", type=int, default=1)
+    scale_parser.add_argument("--seed", type=int, default=0)
+
+    run_all_parser = commands.add_parser("run-all", help="run all days concurrently")
+    run_all_parser.add_argument("days", type=int, nargs="*", help="default: all")
+    run_all_parser.add_argument("--jobs", type=int, help="default: one per core")
+
+    options = parser.parse_args(arguments)
+    match options.command:
+        case "prefetch":
+            start = time.perf_counter_ns()
+            downloaded = prefetch(options.days, options.jobs)
+            print(
+                f"Downloaded {len(downloaded)} inputs in "
+                f"{format_ns(time.perf_counter_ns() - start)}"
+            )
+            return 0
+        case "bench":
+            return int(
+                not bench(
+                    options.days,
+                    options.runs,
+                    options.warmup,
+                    options.threshold,
+                    options.save,
+                )
+            )
+        case "run":
+            module = load_day(options.day)
+            with (
+                as_day(options.day),
+                Timer(
+                    options.day,
+                    profile=options.profile,
+                    memory=options.memory,
+                    trace=options.trace,
+                ) as timer,
+            ):
+                module.main(timer)
+            return 0
+        case "scale":
+            scaling(options.day, options.scales, options.runs, options.seed)
+            return 0
+        case "run-all":
+            return int(not run_all(options.days, options.jobs))
+    return 1
+
+
+if __name__ == "__main__":
+    # Import this file as aoc so the day scripts share its state.
+    import aoc
+
+    sys.exit(aoc.cli())
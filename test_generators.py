@@ -0,0 +1,31 @@
+"""Run every day on the smallest generated inputs.
+
+Days 15 and 19 take minutes even on tiny inputs, set AOC_SLOW_TESTS to run
+them too.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import aoc
+
+SLOW_DAYS = {15, 19}
+
+
+@pytest.mark.parametrize("scale", [1, 2])
+@pytest.mark.parametrize("day", sorted(aoc.GENERATORS))
+def test_generated_input_runs(
+    day: int, scale: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if day in SLOW_DAYS and not os.environ.get("AOC_SLOW_TESTS"):
+        pytest.skip("slow day, set AOC_SLOW_TESTS to run it")
+    monkeypatch.setattr(aoc, "PROJECT_FOLDER", Path(__file__).parent)
+    module = aoc.load_day(day)
+    aoc.mock_bytes(aoc.generate(day, scale), day)
+    try:
+        with aoc.as_day(day), aoc.Timer(day, silent=True) as timer:
+            module.main(timer)
+    finally:
+        aoc.unmock(day)